@@ -1,42 +1,85 @@
 # Version: 1.0.1
 # Last modified: 2025-10-24 17:33 by CNC-Buddy
 """R290 Heat Pump Integration - Init."""
+import asyncio
 import logging
+from dataclasses import dataclass
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SLAVE
 
-from .hub import R290HeatPumpModbusHub, ModbusBatchManager
-
 DOMAIN = "r290_heatpump"
-PLATFORMS = ["sensor", "number", "select", "button", "switch"]
+PLATFORMS = ("sensor", "number", "select", "button", "switch")
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class EntryStore:
+    """Runtime objects of a config entry, kept in hass.data[DOMAIN][entry_id]."""
+
+    hub: Any = None
+    batch: Any = None
+    slave: int | None = None
+    entry: ConfigEntry | None = None
+    cfg_hash: int | None = None
+
+
+# Written back into the entry by the entities at runtime; no reason to reload
+_RUNTIME_KEYS = frozenset((
+    "t_out_min", "t_out_max", "t_flow_min", "t_flow_max", "inertia_hours",
+    "stepsize_c", "deadband_c",
+    "pv_grid_threshold_min_kw", "pv_grid_threshold_max_kw", "pv_grid_threshold_kw",
+    "pv_offset_reset_kw", "pv_battery_threshold_pct", "pv_hold_minutes", "pv_cooldown_minutes",
+    "pv_grid_offset_min", "pv_grid_offset_max", "pv_grid_offset", "pv_battery_offset",
+    "external_offset_value", "external_offset_hold_minutes",
+    "heatcurve_active", "external_offset_enabled", "pv_enabled",
+    "cop_start_ts",
+))
+
+
+def _config_hash(entry: ConfigEntry) -> int:
+    """Fingerprint entry data and options to detect no-op reloads."""
+    return hash(repr(tuple(
+        sorted((k, v) for k, v in source.items() if k not in _RUNTIME_KEYS)
+        for source in (entry.data, entry.options)
+    )))
+
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the integration from YAML (not used, UI only)."""
-    hass.data.setdefault(DOMAIN, {})
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {"_batch_managers": {}}
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up R290 Heat Pump from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    data = entry.data
+    device_type = data.get("device_type", "heat_pump")
 
-    device_type = entry.data.get("device_type", "heat_pump")
+    if device_type != "modbus_bridge":
+        # Changed options/data reload the entry (async_reload_entry skips runtime-only
+        # changes); the bridge options flow swaps the live hub instead
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     # Early exit: COP calculator does not need Modbus host/port
     if device_type == "cop_calculator":
-        hass.data[DOMAIN][entry.entry_id] = {"entry": entry}
+        hass.data[DOMAIN][entry.entry_id] = EntryStore(entry=entry, cfg_hash=_config_hash(entry))
         _LOGGER.info("Setting up R290 Heat Pump COP Calculator entry: %s", entry.title)
         _LOGGER.debug("Forwarding entry %s to platforms: %s", entry.entry_id, PLATFORMS)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         return True
 
-    host = entry.data[CONF_HOST]
-    port = entry.data.get(CONF_PORT, 502)
-    unit = int(entry.data.get(CONF_SLAVE) or 1)
+    # pymodbus is only needed for Modbus-backed entries
+    from .hub import R290HeatPumpModbusHub, ModbusBatchManager
+    from .const import DEFAULT_SCAN_INTERVALS
+
+    host = data[CONF_HOST]
+    port = data.get(CONF_PORT, 502)
+    unit = int(data.get(CONF_SLAVE) or 1)
 
     _LOGGER.info(
         "Setting up R290 Heat Pump entry: %s (host=%s, port=%s, slave=%s)",
@@ -47,51 +90,79 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     )
 
     # Hub-Instanz pro Entry erzeugen (geteilt für alle Plattformen)
-    hub = R290HeatPumpModbusHub(host, port, mode=entry.data.get("connection_type", "rtuovertcp"))
-    batch = ModbusBatchManager(hass, hub, unit)
+    hub = R290HeatPumpModbusHub(
+        host,
+        port,
+        mode=data.get("connection_type", "rtuovertcp"),
+        tcp_nodelay=data.get("tcp_nodelay", True),
+        tcp_quickack=data.get("tcp_quickack", True),
+        so_keepalive=data.get("so_keepalive", True),
+    )
+    # An empty saved mapping means "no overrides", not "use the defaults"
+    scan_intervals = entry.options.get("scan_intervals")
+    if scan_intervals is None:
+        scan_intervals = DEFAULT_SCAN_INTERVALS
+    batch = ModbusBatchManager(
+        hass,
+        hub,
+        unit,
+        scan_intervals,
+        block_size=data.get("block_size", 49),
+        block_pause=data.get("block_pause", 0.05),
+        # Unused registers bridged per read block; 0 keeps blocks to implemented registers
+        max_gap=data.get("block_max_gap", 0),
+    )
+    # Setpoint-Schreibzugriffe kurz sammeln und als FC16 senden
+    batch.enable_write_coalescing(window_ms=float(data.get("block_pause", 0.05)) * 1000)
+    # Single reader draining the bounded request queue; cancelled on unload
+    entry.async_create_background_task(hass, batch.worker_loop(), "r290_modbus_worker")
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "hub": hub,
-        "batch": batch,
-        "slave": unit,
-    }
+    hass.data[DOMAIN][entry.entry_id] = EntryStore(
+        hub=hub, batch=batch, slave=unit, cfg_hash=_config_hash(entry)
+    )
 
     # Domain-level registry so options flows and bridge status can work
     domain_store = hass.data[DOMAIN]
-    try:
-        managers = domain_store.setdefault("_batch_managers", {})
-        managers[int(unit)] = batch
-    except Exception:
-        pass
+    domain_store["_batch_managers"][unit] = batch
     if device_type == "modbus_bridge":
         domain_store["hub"] = hub
         domain_store["connection"] = {
             "host": host,
             "port": port,
-            "connection_type": entry.data.get("connection_type", "rtuovertcp"),
-            "connect_timeout": entry.data.get("connect_timeout", 8.0),
-            "connect_retries": entry.data.get("connect_retries", 2),
-            "request_timeout": entry.data.get("request_timeout", 5.0),
-            "block_size": entry.data.get("block_size", 49),
-            "block_pause": entry.data.get("block_pause", 0.05),
+            "connection_type": data.get("connection_type", "rtuovertcp"),
+            "connect_timeout": data.get("connect_timeout", 8.0),
+            "connect_retries": data.get("connect_retries", 2),
+            "request_timeout": data.get("request_timeout", 5.0),
+            "block_size": data.get("block_size", 49),
+            "block_pause": data.get("block_pause", 0.05),
+            "tcp_nodelay": data.get("tcp_nodelay", True),
+            "tcp_quickack": data.get("tcp_quickack", True),
+            "so_keepalive": data.get("so_keepalive", True),
         }
 
     # Plattform-Setup: ab HA 2025.1 muss awaited werden
+    # Connect to the bridge while the platforms build their entities
     _LOGGER.debug("Forwarding entry %s to platforms: %s", entry.entry_id, PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        batch.async_prefetch_all(),
+    )
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
+    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+        # Setup never completed, nothing was forwarded to the platforms
+        return True
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    hub_data = hass.data[DOMAIN].pop(entry.entry_id, None)
-    if hub_data:
-        hub = hub_data.get("hub")
+    hub_data = hass.data[DOMAIN].pop(entry.entry_id)
+    if hub_data.hub is not None:
         try:
-            await hub.async_close()
+            await hub_data.hub.async_close()
         except Exception as err:
             _LOGGER.warning("Error closing Modbus hub for %s: %s", entry.title, err)
 
@@ -100,5 +171,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if store is not None and store.cfg_hash == _config_hash(entry):
+        # Nothing changed: keep the Modbus connection and polled values
+        _LOGGER.debug("Configuration of %s unchanged, skipping reload", entry.title)
+        return
+    # HA's helper serialises concurrent reloads of the same entry
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -7,10 +7,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN
+from .const import DOMAIN, DOMAIN_KEY_BRIDGE_STATUS
 
 _LOGGER = logging.getLogger(__name__)
 
+_BRIDGE_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, "r290_heatpump_bridge")},
+    name="R290 Heat Pump Modbus Bridge",
+    manufacturer="R290 Heat Pump",
+    model="Modbus Bridge",
+    sw_version="1.0.0",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,20 +31,12 @@ async def async_setup_entry(
 
     if device_type == "modbus_bridge":
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
             _LOGGER.error("Internal Modbus hub not initialised")
             return
-        hub = store["hub"]
-
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, "r290_heatpump_bridge")},
-            name="R290 Heat Pump Modbus Bridge",
-            manufacturer="R290 Heat Pump",
-            model="Modbus Bridge",
-            sw_version="1.0.0",
-        )
+        hub = store.hub
 
-        entities.append(R290HeatPumpModbusReconnectButton(hass, hub, device_info))
+        entities.append(R290HeatPumpModbusReconnectButton(hub, _BRIDGE_DEVICE_INFO))
 
     async_add_entities(entities, update_before_add=False)
 
@@ -45,32 +45,47 @@ async def async_setup_entry(
 
 
 class R290HeatPumpModbusReconnectButton(ButtonEntity):
-    def __init__(self, hass: HomeAssistant, hub, device_info: DeviceInfo) -> None:
+    # Entity already provides __dict__ for _attr_*; slot only our own fields
+    __slots__ = ("_hub",)
+
+    def __init__(self, hub, device_info: DeviceInfo) -> None:
         super().__init__()
-        self._hass = hass
         self._hub = hub
         self._attr_name = "Reconnect Modbus"
         self._attr_unique_id = "r290_heatpump_bridge_reconnect"
         self._attr_device_info = device_info
 
     async def async_press(self) -> None:
+        # Skip the close/connect cycle while the link is demonstrably working
+        if self._hub.is_healthy():
+            self._schedule_refresh()
+            return
+        from .hub import ModbusException
+
         try:
-            try:
-                await self._hub.async_close()
-            except Exception:
-                pass
+            # async_close() already swallows errors from the old client
+            await self._hub.async_close()
             await self._hub.async_connect()
-            # Try to refresh the bridge status sensor
-            ent = self._hass.data.get(DOMAIN, {}).get("sensor.r290_heatpump_bridge_status")
-            if ent is not None:
-                try:
-                    await ent.async_update()
-                    ent.async_write_ha_state()
-                except Exception:
-                    pass
-        except Exception as err:
+            self._schedule_refresh()
+        except (ConnectionError, OSError, ModbusException, TimeoutError) as err:
             _LOGGER.error("Reconnect failed: %s", err)
 
+    def _schedule_refresh(self) -> None:
+        """Refresh the status sensor without keeping the press pending."""
+        self.hass.async_create_background_task(self._refresh_status(), "r290_bridge_refresh")
+
+    async def _refresh_status(self) -> None:
+        """Try to refresh the bridge status sensor."""
+        ref = self.hass.data.get(DOMAIN, {}).get(DOMAIN_KEY_BRIDGE_STATUS)
+        ent = ref and ref()
+        if ent is None:
+            return
+        try:
+            await ent.async_update()
+            ent.async_write_ha_state()
+        except Exception as err:
+            _LOGGER.debug("Bridge status refresh failed: %s", err)
+
 
 
 
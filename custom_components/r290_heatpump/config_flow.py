@@ -1,14 +1,16 @@
 ﻿# Version: 1.0.1
 # Last modified: 2025-10-24 17:33 by CNC-Buddy
+import asyncio
 import logging
+from functools import lru_cache
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_SLAVE, CONF_SCAN_INTERVAL
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.selector import selector
 
-from .hub import R290HeatPumpModbusHub
-from .dashboard import async_setup_dashboard
-from .pv_optimization import PV_CURVE_CONFIG
+from .const import DOMAIN_KEY_BRIDGE_STATUS, DEFAULT_SCAN_INTERVALS
+from . import EntryStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +26,141 @@ DEVICE_TYPES = {
     "cooling_curve": "Cooling Curve",
     "hot_water_curve": "Hot Water Curve",
 }
+DEVICE_TYPES_BY_LABEL = {v: k for k, v in DEVICE_TYPES.items()}
+_DEVICE_TYPE_LABELS = tuple(DEVICE_TYPES.values())
+
+CURVE_TITLES = {
+    "heating_curve": "R290 Heat Pump Heating Curve",
+    "floor_heating_curve": "R290 Heat Pump Floor Heating Curve",
+    "cooling_curve": "R290 Heat Pump Cooling Curve",
+    "hot_water_curve": "R290 Heat Pump Hot Water Curve",
+}
+_CURVE_KINDS = frozenset(CURVE_TITLES)
+
+# Static form schemas, built once at import
+_MODBUS_BRIDGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
+        vol.Required("host"): str,
+        vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Optional("connect_timeout", default=10.0): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=60.0)),
+        vol.Optional("connect_retries", default=2): selector({"number": {"min": 0, "max": 10, "step": 1, "mode": "box"}}),
+        vol.Optional("request_timeout", default=8.0): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=30.0)),
+        vol.Optional("block_size", default=49): selector({"number": {"min": 1, "max": 125, "step": 1, "mode": "box"}}),
+        vol.Optional("block_pause", default=0.1): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
+        # Optional: create the Lovelace dashboard on first setup
+        vol.Optional("create_dashboard", default=True): bool,
+    }
+)
+
+# Heat pump behind an already configured bridge
+_HEAT_PUMP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SLAVE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=11)),
+        vol.Required(CONF_SCAN_INTERVAL, default=60): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+        vol.Required("long_scan_interval", default=600): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+    }
+)
+
+_HEAT_PUMP_SCHEMA_NEW = vol.Schema(
+    {
+        vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
+        vol.Required("host"): str,
+        vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Required(CONF_SLAVE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=11)),
+        vol.Required(CONF_SCAN_INTERVAL, default=60): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+        vol.Required("long_scan_interval", default=600): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+    }
+)
+
+_COP_CALCULATOR_SCHEMA = vol.Schema(
+    {
+        vol.Required("heat_meter"): selector({"entity": {"domain": "sensor"}}),
+        vol.Required("power_meter"): selector({"entity": {"domain": "sensor"}}),
+        vol.Optional("cop_trigger_on_heat", default=True): bool,
+        vol.Optional("cop_trigger_on_power", default=True): bool,
+    }
+)
+
+# Temperature curve behind an already configured bridge
+_TEMPERATURE_CURVE_SCHEMA = vol.Schema(
+    {
+        vol.Required("outdoor_sensor"): selector({"entity": {"domain": "sensor"}}),
+        vol.Optional("pv_power_sensor"): selector({"entity": {"domain": "sensor"}}),
+        vol.Optional("pv_battery_sensor"): selector({"entity": {"domain": "sensor"}}),
+    }
+)
+
+_TEMPERATURE_CURVE_SCHEMA_NEW = vol.Schema(
+    {
+        vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
+        vol.Required("host"): str,
+        vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Required("outdoor_sensor"): selector({"entity": {"domain": "sensor"}}),
+        vol.Optional("pv_power_sensor"): selector({"entity": {"domain": "sensor"}}),
+        vol.Optional("pv_battery_sensor"): selector({"entity": {"domain": "sensor"}}),
+    }
+)
+
+
+# Typed bridge tuning fields: (key, type, default)
+_BRIDGE_FIELD_TYPES = (
+    ("connect_timeout", float, 8.0),
+    ("connect_retries", int, 2),
+    ("request_timeout", float, 5.0),
+    ("block_size", int, 49),
+    ("block_pause", float, 0.05),
+)
+
+
+# Connection fields baked into a hub instance; changing any needs a new hub
+_HUB_CONN_KEYS = ("host", "port", "connection_type", "connect_timeout", "connect_retries", "request_timeout")
+
+
+def _bridge_conn_defaults(entry):
+    """Connection parameters inherited from an existing bridge entry."""
+    d = entry.data
+    return {
+        "connection_type": d.get("connection_type", "rtuovertcp"),
+        "host": d["host"],
+        "port": d.get("port", 502),
+        "connect_timeout": d.get("connect_timeout", 8.0),
+        "connect_retries": d.get("connect_retries", 2),
+        "request_timeout": d.get("request_timeout", 5.0),
+        "block_size": d.get("block_size", 49),
+        "block_pause": d.get("block_pause", 0.05),
+    }
+
+
+def _entries_by_type(hass):
+    """Group this domain's config entries by device_type in a single pass."""
+    by_type = {}
+    for e in hass.config_entries.async_entries(DOMAIN):
+        by_type.setdefault(e.data.get("device_type"), []).append(e)
+    return by_type
+
+
+def _validate_sensors(hass, user_input, required=("outdoor_sensor",), optional=("pv_power_sensor", "pv_battery_sensor")):
+    """Return {field: "invalid_sensor"} for missing required or unknown entities."""
+    errors = {}
+    states_get = hass.states.get
+    for field in required:
+        val = user_input.get(field)
+        if not val or not states_get(val):
+            errors[field] = "invalid_sensor"
+    for field in optional:
+        val = user_input.get(field)
+        if val and not states_get(val):
+            errors[field] = "invalid_sensor"
+    return errors
+
+
+def _existing_bridge(by_type):
+    """First configured bridge entry that has a host, or None."""
+    for e in by_type.get("modbus_bridge", ()):
+        if e.data.get("host"):
+            return e
+    return None
 
 
 class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -37,63 +174,54 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             device_type_display = user_input["device_type"]
-            device_type = next(key for key, value in DEVICE_TYPES.items() if value == device_type_display)
-            if device_type == "modbus_bridge":
-                return await self.async_step_modbus_bridge()
-            if device_type == "heat_pump":
-                return await self.async_step_heat_pump()
-            if device_type == "cop_calculator":
-                return await self.async_step_cop_calculator()
-            if device_type in ("heating_curve", "floor_heating_curve", "cooling_curve", "hot_water_curve"):
+            device_type = DEVICE_TYPES_BY_LABEL.get(device_type_display)
+            dispatch = {
+                "modbus_bridge": self.async_step_modbus_bridge,
+                "heat_pump": self.async_step_heat_pump,
+                "cop_calculator": self.async_step_cop_calculator,
+            }
+            if device_type in _CURVE_KINDS:
                 # Merke die Auswahl und gehe direkt in den Kurven-Flow ohne erneute Auswahl
                 self._selected_curve_kind = device_type
                 return await self.async_step_temperature_curve()
+            if device_type in dispatch:
+                return await dispatch[device_type]()
             errors["base"] = "invalid_device_type"
 
         # Build choices, hide COP calculator if already configured
-        device_types = dict(DEVICE_TYPES)
-        has_cop = any(e.data.get("device_type") == "cop_calculator" for e in self.hass.config_entries.async_entries(DOMAIN))
-        if has_cop and "cop_calculator" in device_types:
-            device_types.pop("cop_calculator")
+        if "cop_calculator" in _entries_by_type(self.hass):
+            labels = [label for key, label in DEVICE_TYPES.items() if key != "cop_calculator"]
+        else:
+            labels = _DEVICE_TYPE_LABELS
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({vol.Required("device_type"): vol.In(list(device_types.values()))}),
+            data_schema=vol.Schema({vol.Required("device_type"): vol.In(labels)}),
             errors=errors,
         )
 
     async def async_step_modbus_bridge(self, user_input=None):
         errors = {}
-        schema = vol.Schema(
-            {
-                vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
-                vol.Required("host"): str,
-                vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-                vol.Optional("connect_timeout", default=10.0): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=60.0)),
-                vol.Optional("connect_retries", default=2): selector({"number": {"min": 0, "max": 10, "step": 1, "mode": "box"}}),
-                vol.Optional("request_timeout", default=8.0): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=30.0)),
-                vol.Optional("block_size", default=49): selector({"number": {"min": 1, "max": 125, "step": 1, "mode": "box"}}),
-                vol.Optional("block_pause", default=0.1): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
-                # Optional: create the Lovelace dashboard on first setup
-                vol.Optional("create_dashboard", default=True): bool,
-            }
-        )
+        schema = _MODBUS_BRIDGE_SCHEMA
         if user_input is not None:
             try:
                 connection_type = user_input["connection_type"]
                 host = user_input["host"]
                 port = user_input["port"]
-                hub = R290HeatPumpModbusHub(host=host, port=port, mode=connection_type, connect_timeout=float(user_input.get("connect_timeout", 8.0)), connect_retries=int(user_input.get("connect_retries", 2)), request_timeout=float(user_input.get("request_timeout", 5.0)))
+                vals = {k: t(user_input.get(k, d)) for k, t, d in _BRIDGE_FIELD_TYPES}
+                from .hub import R290HeatPumpModbusHub
+                hub = R290HeatPumpModbusHub(host=host, port=port, mode=connection_type, connect_timeout=vals["connect_timeout"], connect_retries=vals["connect_retries"], request_timeout=vals["request_timeout"])
                 await hub.async_connect()
                 try:
                     await hub.async_close()
-                except Exception:
+                except (OSError, asyncio.TimeoutError):
                     pass
                 # Create dashboard immediately if selected
                 try:
                     if bool(user_input.get("create_dashboard", True)):
+                        from .dashboard import async_setup_dashboard
                         await async_setup_dashboard(self.hass)
-                except Exception:
+                except (OSError, HomeAssistantError):
                     _LOGGER.debug("Dashboard creation deferred or failed during flow; can be retried via options.")
                 return self.async_create_entry(
                     title="R290 Heat Pump Modbus Bridge",
@@ -102,11 +230,7 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         "connection_type": connection_type,
                         "host": host,
                         "port": port,
-                        "connect_timeout": float(user_input.get("connect_timeout", 8.0)),
-                        "connect_retries": int(user_input.get("connect_retries", 2)),
-                        "request_timeout": float(user_input.get("request_timeout", 5.0)),
-                        "block_size": int(user_input.get("block_size", 49)),
-                        "block_pause": float(user_input.get("block_pause", 0.05)),
+                        **vals,
                         "create_dashboard": bool(user_input.get("create_dashboard", True)),
                     },
                 )
@@ -117,19 +241,10 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_heat_pump(self, user_input=None):
         errors = {}
-        existing = next(
-            (e for e in self.hass.config_entries.async_entries(DOMAIN) if e.data.get("device_type") == "modbus_bridge" and e.data.get("host")),
-            None,
-        )
+        existing = _existing_bridge(_entries_by_type(self.hass))
 
         if existing is not None:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_SLAVE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=11)),
-                    vol.Required(CONF_SCAN_INTERVAL, default=60): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
-                    vol.Required("long_scan_interval", default=600): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
-                }
-            )
+            schema = _HEAT_PUMP_SCHEMA
             if user_input is not None:
                 try:
                     slave_id = user_input[CONF_SLAVE]
@@ -138,19 +253,12 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     return self.async_create_entry(
                         title=f"R290 Heat Pump (Slave {slave_id})",
                         data={
+                            # Übernehme die Connection-Parameter der Bridge
+                            **_bridge_conn_defaults(existing),
                             "device_type": "heat_pump",
-                            "connection_type": existing.data.get("connection_type", "rtuovertcp"),
-                            "host": existing.data["host"],
-                            "port": existing.data.get("port", 502),
                             CONF_SLAVE: slave_id,  # WICHTIG: Verwende CONF_SLAVE als Key
                             CONF_SCAN_INTERVAL: fast,
                             "long_scan_interval": slow,
-                            # Übernehme auch die anderen Connection-Parameter
-                            "connect_timeout": existing.data.get("connect_timeout", 8.0),
-                            "connect_retries": existing.data.get("connect_retries", 2),
-                            "request_timeout": existing.data.get("request_timeout", 5.0),
-                            "block_size": existing.data.get("block_size", 49),
-                            "block_pause": existing.data.get("block_pause", 0.05),
                         },
                     )
                 except Exception as err:
@@ -158,16 +266,7 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "cannot_connect"
             return self.async_show_form(step_id="heat_pump", data_schema=schema, errors=errors)
 
-        schema = vol.Schema(
-            {
-                vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
-                vol.Required("host"): str,
-                vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-                vol.Required(CONF_SLAVE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=11)),
-                vol.Required(CONF_SCAN_INTERVAL, default=60): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
-                vol.Required("long_scan_interval", default=600): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
-            }
-        )
+        schema = _HEAT_PUMP_SCHEMA_NEW
         if user_input is not None:
             try:
                 connection_type = user_input["connection_type"]
@@ -176,11 +275,12 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 slave_id = user_input[CONF_SLAVE]
                 fast = user_input[CONF_SCAN_INTERVAL]
                 slow = user_input["long_scan_interval"]
+                from .hub import R290HeatPumpModbusHub
                 hub = R290HeatPumpModbusHub(host=host, port=port, mode=connection_type, connect_timeout=10.0, connect_retries=2)
                 await hub.async_connect()
                 try:
                     await hub.async_close()
-                except Exception:
+                except (OSError, asyncio.TimeoutError):
                     pass
                 return self.async_create_entry(
                     title=f"R290 Heat Pump (Slave {slave_id})",
@@ -202,7 +302,7 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_cop_calculator(self, user_input=None):
         errors = {}
         # Prevent multiple COP entries
-        if any(e.data.get("device_type") == "cop_calculator" for e in self.hass.config_entries.async_entries(DOMAIN)):
+        if "cop_calculator" in _entries_by_type(self.hass):
             errors["base"] = "already_configured"
             return self.async_abort(reason="already_configured")
 
@@ -215,9 +315,9 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Basic validation
             if heat_meter == power_sel:
                 errors["heat_meter"] = "same_sensor_selected"
-            elif not self.hass.states.get(heat_meter) or not self.hass.states.get(power_sel):
-                errors["base"] = "invalid_sensor"
             else:
+                errors.update(_validate_sensors(self.hass, user_input, required=("heat_meter", "power_meter"), optional=()))
+            if not errors:
                 return self.async_create_entry(
                     title="R290 Heat Pump COP Calculator",
                     data={
@@ -232,14 +332,7 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Simple form: only meters required
         return self.async_show_form(
             step_id="cop_calculator",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("heat_meter"): selector({"entity": {"domain": "sensor"}}),
-                    vol.Required("power_meter"): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("cop_trigger_on_heat", default=True): bool,
-                    vol.Optional("cop_trigger_on_power", default=True): bool,
-                }
-            ),
+            data_schema=_COP_CALCULATOR_SCHEMA,
             errors=errors,
         )
 
@@ -247,23 +340,10 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         kind = getattr(self, "_selected_curve_kind", None) or "heating_curve"
 
-        existing_bridge = next(
-            (
-                e
-                for e in self.hass.config_entries.async_entries(DOMAIN)
-                if e.data.get("device_type") == "modbus_bridge" and e.data.get("host")
-            ),
-            None,
-        )
+        existing_bridge = _existing_bridge(_entries_by_type(self.hass))
 
         if existing_bridge is not None:
-            schema = vol.Schema(
-                {
-                    vol.Required("outdoor_sensor"): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("pv_power_sensor"): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("pv_battery_sensor"): selector({"entity": {"domain": "sensor"}}),
-                }
-            )
+            schema = _TEMPERATURE_CURVE_SCHEMA
 
             if user_input is not None:
                 outdoor_sensor = user_input.get("outdoor_sensor")
@@ -271,28 +351,15 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 pv_battery = user_input.get("pv_battery_sensor")
 
                 try:
-                    if not outdoor_sensor or not self.hass.states.get(outdoor_sensor):
-                        errors["outdoor_sensor"] = "invalid_sensor"
-                        raise ValueError
-                    if pv_power and not self.hass.states.get(pv_power):
-                        errors["pv_power_sensor"] = "invalid_sensor"
-                        raise ValueError
-                    if pv_battery and not self.hass.states.get(pv_battery):
-                        errors["pv_battery_sensor"] = "invalid_sensor"
-                        raise ValueError
+                    errors.update(_validate_sensors(self.hass, user_input))
+                    if errors:
+                        return self.async_show_form(step_id="temperature_curve", data_schema=schema, errors=errors)
 
                     data = {
+                        **_bridge_conn_defaults(existing_bridge),
                         "device_type": kind,
-                        "connection_type": existing_bridge.data.get("connection_type", "rtuovertcp"),
-                        "host": existing_bridge.data["host"],
-                        "port": existing_bridge.data.get("port", 502),
                         "outdoor_sensor": outdoor_sensor,
                         CONF_SLAVE: 1,
-                        "connect_timeout": existing_bridge.data.get("connect_timeout", 8.0),
-                        "connect_retries": existing_bridge.data.get("connect_retries", 2),
-                        "request_timeout": existing_bridge.data.get("request_timeout", 5.0),
-                        "block_size": existing_bridge.data.get("block_size", 49),
-                        "block_pause": existing_bridge.data.get("block_pause", 0.05),
                     }
                     if pv_power:
                         data["pv_power_sensor"] = pv_power
@@ -300,32 +367,16 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         data["pv_battery_sensor"] = pv_battery
 
                     return self.async_create_entry(
-                        title={
-                            "heating_curve": "R290 Heat Pump Heating Curve",
-                            "floor_heating_curve": "R290 Heat Pump Floor Heating Curve",
-                            "cooling_curve": "R290 Heat Pump Cooling Curve",
-                            "hot_water_curve": "R290 Heat Pump Hot Water Curve",
-                        }.get(kind, "R290 Heat Pump Temperature Curve"),
+                        title=CURVE_TITLES.get(kind, "R290 Heat Pump Temperature Curve"),
                         data=data,
                     )
-                except ValueError:
-                    pass
                 except Exception as err:
                     _LOGGER.error("Temperature curve flow error: %s", err)
                     errors["base"] = "cannot_connect"
 
             return self.async_show_form(step_id="temperature_curve", data_schema=schema, errors=errors)
 
-        schema = vol.Schema(
-            {
-                vol.Required("connection_type", default="rtuovertcp"): vol.In(["rtuovertcp", "tcp"]),
-                vol.Required("host"): str,
-                vol.Required("port", default=502): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-                vol.Required("outdoor_sensor"): selector({"entity": {"domain": "sensor"}}),
-                vol.Optional("pv_power_sensor"): selector({"entity": {"domain": "sensor"}}),
-                vol.Optional("pv_battery_sensor"): selector({"entity": {"domain": "sensor"}}),
-            }
-        )
+        schema = _TEMPERATURE_CURVE_SCHEMA_NEW
 
         if user_input is not None:
             connection_type = user_input["connection_type"]
@@ -336,16 +387,11 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             pv_battery = user_input.get("pv_battery_sensor")
 
             try:
-                if not outdoor_sensor or not self.hass.states.get(outdoor_sensor):
-                    errors["outdoor_sensor"] = "invalid_sensor"
-                    raise ValueError
-                if pv_power and not self.hass.states.get(pv_power):
-                    errors["pv_power_sensor"] = "invalid_sensor"
-                    raise ValueError
-                if pv_battery and not self.hass.states.get(pv_battery):
-                    errors["pv_battery_sensor"] = "invalid_sensor"
-                    raise ValueError
+                errors.update(_validate_sensors(self.hass, user_input))
+                if errors:
+                    return self.async_show_form(step_id="temperature_curve", data_schema=schema, errors=errors)
 
+                from .hub import R290HeatPumpModbusHub
                 hub = R290HeatPumpModbusHub(host=host, port=port, mode=connection_type, connect_timeout=10.0, connect_retries=2)
                 await hub.async_connect()
                 await hub.async_close()
@@ -364,16 +410,9 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data["pv_battery_sensor"] = pv_battery
 
                 return self.async_create_entry(
-                    title={
-                        "heating_curve": "R290 Heat Pump Heating Curve",
-                        "floor_heating_curve": "R290 Heat Pump Floor Heating Curve",
-                        "cooling_curve": "R290 Heat Pump Cooling Curve",
-                        "hot_water_curve": "R290 Heat Pump Hot Water Curve",
-                    }.get(kind, "R290 Heat Pump Temperature Curve"),
+                    title=CURVE_TITLES.get(kind, "R290 Heat Pump Temperature Curve"),
                     data=data,
                 )
-            except ValueError:
-                pass
             except Exception as err:
                 _LOGGER.error("Temperature curve flow error: %s", err)
                 errors["base"] = "cannot_connect"
@@ -384,37 +423,117 @@ class R290HeatPumpModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return await self.async_step_user(import_info)
 
 
+def _parse_scan_intervals(text: str):
+    """Parse "addr=seconds, ..." into {"0x005D": 300}; None if malformed."""
+    result = {}
+    for item in (text or "").replace(";", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        addr, sep, seconds = item.partition("=")
+        try:
+            key = int(addr.strip(), 0)
+            value = int(seconds.strip())
+        except ValueError:
+            return None
+        if not sep or not 0 <= key <= 0xFFFF or not 5 <= value <= 86400:
+            return None
+        result[f"0x{key:04X}"] = value
+    return result
+
+
+# Options schemas depend only on their defaults; usually one tuple per entry
+@lru_cache(maxsize=8)
+def _bridge_options_schema(mode, host, port, ct, cr, rt, bs, bp):
+    return vol.Schema(
+        {
+            vol.Required("connection_type", default=mode): vol.In(["rtuovertcp", "tcp"]),
+            vol.Required("host", default=host): str,
+            vol.Required("port", default=port): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+            vol.Optional("connect_timeout", default=ct): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=60.0)),
+            vol.Optional("connect_retries", default=cr): selector({"number": {"min": 0, "max": 10, "step": 1, "mode": "box"}}),
+            vol.Optional("request_timeout", default=rt): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=30.0)),
+            vol.Optional("block_size", default=bs): selector({"number": {"min": 1, "max": 125, "step": 1, "mode": "box"}}),
+            vol.Optional("block_pause", default=bp): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
+            # Action checkbox to (re)create the Lovelace dashboard on demand
+            vol.Optional("recreate_dashboard", default=False): bool,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _cop_options_schema(heat, power, trig_heat, trig_power, consolidated):
+    return vol.Schema(
+        {
+            vol.Required("heat_meter", default=heat): selector({"entity": {"domain": "sensor"}}),
+            vol.Required("power_meter", default=power): selector({"entity": {"domain": "sensor"}}),
+            vol.Optional("cop_trigger_on_heat", default=trig_heat): bool,
+            vol.Optional("cop_trigger_on_power", default=trig_power): bool,
+            # One energy and one heat entity with the periods as attributes
+            vol.Optional("cop_consolidated_sensors", default=consolidated): bool,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _curve_options_schema(outdoor, power, battery):
+    return vol.Schema(
+        {
+            vol.Required("outdoor_sensor", default=outdoor): selector({"entity": {"domain": "sensor"}}),
+            vol.Optional("pv_power_sensor", default=power): selector({"entity": {"domain": "sensor"}}),
+            vol.Optional("pv_battery_sensor", default=battery): selector({"entity": {"domain": "sensor"}}),
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _device_options_schema(fast, slow, overrides):
+    return vol.Schema(
+        {
+            vol.Required(CONF_SCAN_INTERVAL, default=fast): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+            vol.Required("long_scan_interval", default=slow): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+            # Per-register overrides, e.g. "0x005D=300, 0x0040=5"
+            vol.Optional("scan_intervals", default=overrides): str,
+        }
+    )
+
+
 class R290HeatPumpOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._entry = config_entry
 
     async def async_step_init(self, user_input=None):
         errors = {}
-        data = self._entry.data
-        opts = dict(self._entry.options)
+        hass = self.hass
+        entry = self._entry
+        data = entry.data
+        opts = dict(entry.options)
+        cfg_entries = hass.config_entries
+        hass_data = hass.data
         device_type = data.get("device_type")
         default_fast = opts.get(CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, 60))
         default_long = opts.get("long_scan_interval", data.get("long_scan_interval", 600))
-        domain_store = self.hass.data.get(DOMAIN, {})
+        # Without saved overrides the built-in defaults apply; show them so they can be cleared
+        saved_overrides = opts.get("scan_intervals")
+        if saved_overrides is None:
+            saved_overrides = {f"0x{addr:04X}": seconds for addr, seconds in DEFAULT_SCAN_INTERVALS.items()}
+        default_overrides = ", ".join(f"{addr}={seconds}" for addr, seconds in saved_overrides.items())
+        domain_store = hass_data.get(DOMAIN, {})
         conn = domain_store.get("connection", {})
         default_mode = conn.get("connection_type", data.get("connection_type", "rtuovertcp"))
         default_host = conn.get("host", data.get("host", ""))
         default_port = conn.get("port", data.get("port", 502))
 
         if device_type == "modbus_bridge":
-            schema = vol.Schema(
-                {
-                    vol.Required("connection_type", default=default_mode): vol.In(["rtuovertcp", "tcp"]),
-                    vol.Required("host", default=default_host): str,
-                    vol.Required("port", default=default_port): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-                    vol.Optional("connect_timeout", default=conn.get("connect_timeout", 8.0)): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=60.0)),
-                    vol.Optional("connect_retries", default=conn.get("connect_retries", 2)): selector({"number": {"min": 0, "max": 10, "step": 1, "mode": "box"}}),
-                    vol.Optional("request_timeout", default=conn.get("request_timeout", 5.0)): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=30.0)),
-                    vol.Optional("block_size", default=conn.get("block_size", 49)): selector({"number": {"min": 1, "max": 125, "step": 1, "mode": "box"}}),
-                    vol.Optional("block_pause", default=conn.get("block_pause", 0.05)): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
-                    # Action checkbox to (re)create the Lovelace dashboard on demand
-                    vol.Optional("recreate_dashboard", default=False): bool,
-                }
+            schema = _bridge_options_schema(
+                default_mode,
+                default_host,
+                default_port,
+                conn.get("connect_timeout", 8.0),
+                conn.get("connect_retries", 2),
+                conn.get("request_timeout", 5.0),
+                conn.get("block_size", 49),
+                conn.get("block_pause", 0.05),
             )
         elif device_type == "cop_calculator":
             # Defaults from current data
@@ -426,32 +545,15 @@ class R290HeatPumpOptionsFlow(config_entries.OptionsFlow):
                 p_default = ""
             trig_heat_def = bool(opts.get("cop_trigger_on_heat", data.get("cop_trigger_on_heat", True)))
             trig_power_def = bool(opts.get("cop_trigger_on_power", data.get("cop_trigger_on_power", True)))
-            schema = vol.Schema(
-                {
-                    vol.Required("heat_meter", default=cur_heat): selector({"entity": {"domain": "sensor"}}),
-                    vol.Required("power_meter", default=p_default): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("cop_trigger_on_heat", default=trig_heat_def): bool,
-                    vol.Optional("cop_trigger_on_power", default=trig_power_def): bool,
-                }
-            )
-        elif device_type in PV_CURVE_CONFIG:
+            consolidated_def = bool(opts.get("cop_consolidated_sensors", data.get("cop_consolidated_sensors", False)))
+            schema = _cop_options_schema(cur_heat, p_default, trig_heat_def, trig_power_def, consolidated_def)
+        elif device_type in _CURVE_KINDS:
             default_outdoor = opts.get("outdoor_sensor", data.get("outdoor_sensor", ""))
             default_power = opts.get("pv_power_sensor", data.get("pv_power_sensor"))
             default_battery = opts.get("pv_battery_sensor", data.get("pv_battery_sensor"))
-            schema = vol.Schema(
-                {
-                    vol.Required("outdoor_sensor", default=default_outdoor): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("pv_power_sensor", default=default_power): selector({"entity": {"domain": "sensor"}}),
-                    vol.Optional("pv_battery_sensor", default=default_battery): selector({"entity": {"domain": "sensor"}}),
-                }
-            )
+            schema = _curve_options_schema(default_outdoor, default_power, default_battery)
         else:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_SCAN_INTERVAL, default=default_fast): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
-                    vol.Required("long_scan_interval", default=default_long): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
-                }
-            )
+            schema = _device_options_schema(default_fast, default_long, default_overrides)
 
         if user_input is not None:
             try:
@@ -459,109 +561,107 @@ class R290HeatPumpOptionsFlow(config_entries.OptionsFlow):
                     mode = user_input["connection_type"]
                     host = user_input["host"]
                     port = int(user_input["port"])
-                    test_hub = R290HeatPumpModbusHub(host=host, port=port, mode=mode, connect_timeout=float(user_input.get("connect_timeout", 8.0)), connect_retries=int(user_input.get("connect_retries", 2)), request_timeout=float(user_input.get("request_timeout", 5.0)))
-                    await test_hub.async_connect()
-                    try:
-                        await test_hub.async_close()
-                    except Exception:
-                        pass
-
-                    domain_store = self.hass.data.setdefault(DOMAIN, {})
-                    old_hub = domain_store.get("hub")
-                    new_hub = R290HeatPumpModbusHub(host=host, port=port, mode=mode, connect_timeout=float(user_input.get("connect_timeout", 8.0)), connect_retries=int(user_input.get("connect_retries", 2)), request_timeout=float(user_input.get("request_timeout", 5.0)))
-                    await new_hub.async_connect()
-                    domain_store["hub"] = new_hub
-                    domain_store["connection"] = {
+                    vals = {k: t(user_input.get(k, d)) for k, t, d in _BRIDGE_FIELD_TYPES}
+                    domain_store = hass_data.setdefault(DOMAIN, {})
+                    old_conn = domain_store.get("connection", {})
+                    new_conn = {
                         "host": host,
                         "port": port,
                         "connection_type": mode,
-                        "connect_timeout": float(user_input.get("connect_timeout", 8.0)),
-                        "connect_retries": int(user_input.get("connect_retries", 2)),
-                        "request_timeout": float(user_input.get("request_timeout", 5.0)),
-                        "block_size": int(user_input.get("block_size", 49)),
-                        "block_pause": float(user_input.get("block_pause", 0.05)),
+                        **vals,
                     }
-                    # Update all batch managers with new hub and parameters
+                    old_hub = domain_store.get("hub")
                     batch_managers = domain_store.get("_batch_managers", {})
-                    for unit, batch in batch_managers.items():
-                        batch.replace_hub(new_hub)
-                        batch.update_batch_params(
-                            block_size=int(domain_store["connection"].get("block_size", 49)),
-                            block_pause=float(domain_store["connection"].get("block_pause", 0.05)),
-                        )
-                    
-                    # Update store references for all entries
-                    for key, store in list(domain_store.items()):
-                        if not isinstance(store, dict) or "entry" not in store:
-                            continue
-                        store["hub"] = new_hub
-                    
-                    if old_hub is not None:
-                        try:
-                            await old_hub.async_close()
-                        except Exception:
-                            pass
-
-                    current = dict(self._entry.data)
-                    current.update({
+
+                    if old_hub is not None and all(old_conn.get(k) == new_conn[k] for k in _HUB_CONN_KEYS):
+                        # Same endpoint and timeouts: keep the hub, only retune batching
+                        if (old_conn.get("block_size"), old_conn.get("block_pause")) != (vals["block_size"], vals["block_pause"]):
+                            for batch in batch_managers.values():
+                                batch.update_batch_params(
+                                    block_size=vals["block_size"],
+                                    block_pause=vals["block_pause"],
+                                )
+                        domain_store["connection"] = new_conn
+                    else:
+                        from .hub import R290HeatPumpModbusHub
+
+                        # Connect the replacement hub first; a failure leaves the current hub in place
+                        new_hub = R290HeatPumpModbusHub(host=host, port=port, mode=mode, connect_timeout=vals["connect_timeout"], connect_retries=vals["connect_retries"], request_timeout=vals["request_timeout"])
+                        await new_hub.async_connect()
+
+                        domain_store["hub"] = new_hub
+                        domain_store["connection"] = new_conn
+                        # Update all batch managers with new hub and parameters
+                        for batch in batch_managers.values():
+                            batch.replace_hub(new_hub)
+                            batch.update_batch_params(
+                                block_size=vals["block_size"],
+                                block_pause=vals["block_pause"],
+                            )
+
+                        # Update store references for all entries
+                        for store in list(domain_store.values()):
+                            if not isinstance(store, EntryStore) or store.entry is None:
+                                continue
+                            store.hub = new_hub
+
+                        if old_hub is not None:
+                            try:
+                                await old_hub.async_close()
+                            except (OSError, asyncio.TimeoutError):
+                                pass
+
+                    new_data = {
+                        **data,
                         "connection_type": mode,
                         "host": host,
                         "port": port,
-                        "connect_timeout": float(user_input.get("connect_timeout", 8.0)),
-                        "connect_retries": int(user_input.get("connect_retries", 2)),
-                        "request_timeout": float(user_input.get("request_timeout", 5.0)),
-                        "block_size": int(user_input.get("block_size", 49)),
-                        "block_pause": float(user_input.get("block_pause", 0.05)),
-                    })
-                    self.hass.config_entries.async_update_entry(self._entry, data=current)
+                        **vals,
+                    }
+                    cfg_entries.async_update_entry(entry, data=new_data)
                     # Recreate dashboard if requested
                     try:
                         if bool(user_input.get("recreate_dashboard", False)):
-                            await async_setup_dashboard(self.hass)
-                    except Exception:
+                            from .dashboard import async_setup_dashboard
+                            await async_setup_dashboard(hass)
+                    except (OSError, HomeAssistantError):
                         _LOGGER.debug("Dashboard creation deferred or failed in options flow.")
                     try:
-                        ent = self.hass.data.get(DOMAIN, {}).get("sensor.r290_heatpump_bridge_status")
+                        ref = hass_data.get(DOMAIN, {}).get(DOMAIN_KEY_BRIDGE_STATUS)
+                        ent = ref and ref()
                         if ent is not None:
                             await ent.async_update()
                             ent.async_write_ha_state()
-                    except Exception:
+                    except (HomeAssistantError, RuntimeError):
                         pass
-                    return self.async_create_entry(title="Options", data=self._entry.options)
+                    return self.async_create_entry(title="Options", data=entry.options)
                 elif device_type == "cop_calculator":
                     heat = user_input["heat_meter"]
                     power_sel = user_input["power_meter"]
                     trig_heat = bool(user_input.get("cop_trigger_on_heat", True))
                     trig_power = bool(user_input.get("cop_trigger_on_power", True))
-                    current = dict(self._entry.data)
+                    new_data = {**data, "heat_meter": heat, "power_meter": power_sel}
                     # Remove any legacy db_url
-                    current.pop("db_url", None)
-                    current.update({"heat_meter": heat, "power_meter": power_sel})
-                    self.hass.config_entries.async_update_entry(self._entry, data=current)
-                    new_opts = dict(self._entry.options)
+                    new_data.pop("db_url", None)
+                    new_opts = dict(entry.options)
                     new_opts["cop_trigger_on_heat"] = trig_heat
                     new_opts["cop_trigger_on_power"] = trig_power
+                    new_opts["cop_consolidated_sensors"] = bool(user_input.get("cop_consolidated_sensors", False))
+                    # Data und Options in einem Update, sonst lädt der Listener zweimal neu
+                    cfg_entries.async_update_entry(entry, data=new_data, options=new_opts)
                     return self.async_create_entry(title="Options", data=new_opts)
-                elif device_type in PV_CURVE_CONFIG:
-                    new_opts = dict(self._entry.options)
+                elif device_type in _CURVE_KINDS:
+                    new_opts = dict(entry.options)
 
                     outdoor_sensor = user_input["outdoor_sensor"]
                     pv_power = user_input.get("pv_power_sensor")
                     pv_battery = user_input.get("pv_battery_sensor")
 
-                    if not outdoor_sensor or not self.hass.states.get(outdoor_sensor):
-                        errors["outdoor_sensor"] = "invalid_sensor"
-                        raise ValueError
-                    if pv_power and not self.hass.states.get(pv_power):
-                        errors["pv_power_sensor"] = "invalid_sensor"
-                        raise ValueError
-                    if pv_battery and not self.hass.states.get(pv_battery):
-                        errors["pv_battery_sensor"] = "invalid_sensor"
-                        raise ValueError
+                    errors.update(_validate_sensors(hass, user_input))
+                    if errors:
+                        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
-                    current_data = dict(self._entry.data)
-                    current_data["outdoor_sensor"] = outdoor_sensor
-                    self.hass.config_entries.async_update_entry(self._entry, data=current_data)
+                    new_data = {**data, "outdoor_sensor": outdoor_sensor}
 
                     if pv_power in (None, ""):
                         new_opts.pop("pv_power_sensor", None)
@@ -573,11 +673,20 @@ class R290HeatPumpOptionsFlow(config_entries.OptionsFlow):
                     else:
                         new_opts["pv_battery_sensor"] = pv_battery
 
+                    # One update for data and options so the entry reloads only once
+                    cfg_entries.async_update_entry(entry, data=new_data, options=new_opts)
                     return self.async_create_entry(title="Options", data=new_opts)
                 else:
                     fast = int(user_input[CONF_SCAN_INTERVAL])
                     slow = int(user_input["long_scan_interval"])
-                    return self.async_create_entry(title="Options", data={CONF_SCAN_INTERVAL: fast, "long_scan_interval": slow})
+                    new_opts = {CONF_SCAN_INTERVAL: fast, "long_scan_interval": slow}
+                    overrides = _parse_scan_intervals(user_input.get("scan_intervals", ""))
+                    if overrides is None:
+                        errors["scan_intervals"] = "invalid_scan_intervals"
+                        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+                    # Stored even when empty: a cleared field disables the defaults
+                    new_opts["scan_intervals"] = overrides
+                    return self.async_create_entry(title="Options", data=new_opts)
             except Exception as err:
                 _LOGGER.error("Options flow error: %s", err)
                 errors["base"] = "cannot_connect"
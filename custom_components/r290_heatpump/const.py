@@ -6,4 +6,13 @@ from homeassistant.const import Platform
 
 DOMAIN = "r290_heatpump"
 
+# hass.data[DOMAIN] key holding a weakref to the bridge status sensor
+DOMAIN_KEY_BRIDGE_STATUS = "_bridge_status_entity"
+
+# Per-register poll interval overrides in seconds (address -> seconds).
+# Slow-changing totalisers do not need the fast realtime cycle.
+DEFAULT_SCAN_INTERVALS = {
+    0x005D: 300,  # Total unit electricity consumption
+}
+
 PLATFORMS = [Platform.SENSOR, Platform.NUMBER, Platform.SELECT, Platform.BUTTON, Platform.SWITCH]
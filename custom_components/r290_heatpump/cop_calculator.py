@@ -1,25 +1,40 @@
 # Version: 1.0.1
 # Last modified: 2025-10-24 17:33 by CNC-Buddy
 import logging
-from datetime import datetime, timedelta, date
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import timedelta, date
+from itertools import accumulate
 from typing import Optional
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.const import UnitOfEnergy
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.storage import Store
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "r290_heatpump"
 
+# States that cannot be parsed as a number
+_BAD = frozenset((None, 'unknown', 'unavailable'))
+
+# Sent by the accumulator with the set of kinds ('energy'/'heat') that received a delta
+SIGNAL_ACC_CHANGED = "r290_acc_changed"
+
 class R290HeatPumpCOPSensorBase(SensorEntity):
     """Base class for R290 Heat Pump COP sensors."""
 
+    __slots__ = ('_hass', '_entry', '_state', '_heat_meter', '_power_meters', '_acc')
+
     _attr_device_class = "power_factor"
     _attr_native_unit_of_measurement = None  # COP ist dimensionslos
     _attr_state_class = "measurement"
@@ -29,7 +44,7 @@ class R290HeatPumpCOPSensorBase(SensorEntity):
     # Evaluate every 5 minutes
     SCAN_INTERVAL = timedelta(minutes=5)
 
-    def __init__(self, hass, entry, device_info, name, unique_id_suffix):
+    def __init__(self, hass, entry, device_info, name, unique_id_suffix, acc=None):
         """Initialize the COP sensor."""
         super().__init__()
         self._hass = hass
@@ -51,6 +66,8 @@ class R290HeatPumpCOPSensorBase(SensorEntity):
         if not self._power_meters:
             _LOGGER.warning("No power meters configured for COP; please set 'power_meter' in entry data (comma separated for multiple meters)")
         self._attr_should_poll = True
+        # Shared accumulator, created by setup_cop_sensors before the sensors
+        self._acc = acc
         _LOGGER.debug(f"Initialized {self._attr_name} with heat_meter={self._heat_meter}, power_meters={self._power_meters}")
 
     async def async_added_to_hass(self):
@@ -67,22 +84,84 @@ class R290HeatPumpCOPSensorBase(SensorEntity):
         return self._state
 
 
+# (label, period) of the energy/heat helper sensors
+_PERIODS = (
+    ('Overall', 'overall'),
+    ('Today', 'today'),
+    ('Yesterday', 'yesterday'),
+    ('Last 7 Days', '7d'),
+    ('Last 30 Days', '30d'),
+    ('Last 365 Days', '365d'),
+)
+
+
+# period -> total of one accumulator source (acc, kind)
+_PERIOD_DISPATCH = {
+    'today': lambda acc, kind: float(getattr(acc, kind).buckets.get(acc._today(), 0.0)),
+    'yesterday': lambda acc, kind: float(getattr(acc, kind).buckets.get(acc._today() - timedelta(days=1), 0.0)),
+    '7d': lambda acc, kind: acc._sum_days(kind, 7),
+    '30d': lambda acc, kind: acc._sum_days(kind, 30),
+    '365d': lambda acc, kind: acc._sum_days(kind, 365),
+    'overall': lambda acc, kind: getattr(acc, kind).prefix[-1] - getattr(acc, kind).prefix[0],
+}
+
+# Latin-1 non-alphanumerics -> '_' (entity ids are ASCII anyway)
+_SLUG_TABLE = {i: '_' for i in range(256) if not chr(i).isalnum()}
+
+
 def _slugify(src: str) -> str:
-    return "".join(ch if ch.isalnum() else "_" for ch in src).strip("_")
+    return src.translate(_SLUG_TABLE).strip("_")
+
+
+def _parse_day(key) -> Optional[date]:
+    """Stored bucket key -> date, None for anything that is not "YYYY-MM-DD"."""
+    if not isinstance(key, str):
+        return None
+    try:
+        return date.fromisoformat(key)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class _Source:
+    """Daily buckets of one meter plus their sorted index."""
+
+    last: Optional[float] = None
+    # date -> kWh, oldest day first
+    buckets: OrderedDict = field(default_factory=OrderedDict)
+    # Sorted bucket days and running totals (prefix[i] = sum of days[:i])
+    days: list = field(default_factory=list)
+    prefix: list = field(default_factory=lambda: [0.0])
 
 
 class _EnergyAccumulator:
     """In-memory energy accumulator per source starting now (no SQL/statistics)."""
 
+    __slots__ = (
+        '_hass', '_store', 'energy', 'heat', '_entities', '_loaded',
+        '_last_seen', '_period_cache', '_today_cached', '_today_until', '_load_task', '_save_handle',
+    )
+
     def __init__(self, hass, power_entity: str, heat_entity: str):
         self._hass = hass
         self._store: Store = Store(hass, 1, f"{DOMAIN}_cop_accumulator")
-        self._sources = {
-            'energy': { 'last': None, 'buckets': {} },
-            'heat':   { 'last': None, 'buckets': {} },
-        }
+        # One _Source per kind; attribute name == kind ('energy'/'heat')
+        self.energy = _Source()
+        self.heat = _Source()
         self._entities = { 'energy': power_entity, 'heat': heat_entity }
         self._loaded = False
+        # kind -> last_updated of the source state already folded into the buckets
+        self._last_seen: dict = {}
+        # kind -> (day, {period: total}) for get_all_periods
+        self._period_cache: dict[str, tuple] = {}
+        # Today's date and the epoch time of the next local midnight, when it goes stale
+        self._today_cached: Optional[date] = None
+        self._today_until = 0.0
+        # In-flight store load shared by all concurrent callers
+        self._load_task = None
+        # Cancel callable of the pending delayed save (None = nothing scheduled)
+        self._save_handle = None
 
     def reconfigure(self, power_entity: str, heat_entity: str) -> None:
         """Update bound entities without losing accumulated buckets.
@@ -97,32 +176,70 @@ class _EnergyAccumulator:
             old_power = None
             old_heat = None
         if power_entity != old_power:
-            self._sources['energy']['last'] = None
+            self.energy.last = None
+            self._last_seen.pop('energy', None)
         if heat_entity != old_heat:
-            self._sources['heat']['last'] = None
+            self.heat.last = None
+            self._last_seen.pop('heat', None)
         self._entities = { 'energy': power_entity, 'heat': heat_entity }
 
-    def _today(self) -> str:
-        return dt_util.now().date().isoformat()
+    def _today(self) -> date:
+        # time.time() is much cheaper than building an aware datetime on every call
+        if time.time() >= self._today_until:
+            today = dt_util.now().date()
+            self._today_cached = today
+            self._today_until = dt_util.start_of_local_day(today + timedelta(days=1)).timestamp()
+        return self._today_cached
+
+    def _reindex(self, kind: str) -> None:
+        """Rebuild sorted days and prefix sums of one source from its buckets.
+
+        Also re-inserts the buckets in date order so the oldest day is first.
+        """
+        src = getattr(self, kind)
+        days = sorted(src.buckets)
+        src.buckets = OrderedDict((d, src.buckets[d]) for d in days)
+        src.days = days
+        src.prefix = list(accumulate((src.buckets[d] for d in days), initial=0.0))
+        self._period_cache.pop(kind, None)
 
     def _add_delta(self, kind: str, delta: float) -> bool:
         if delta <= 0:
             return False
+        delta = float(delta)
         today = self._today()
-        buckets = self._sources[kind]['buckets']
-        buckets[today] = float(buckets.get(today, 0.0) + delta)
-        # keep buckets bounded (e.g., 500 days)
-        if len(buckets) > 520:
-            try:
-                for d in sorted(buckets.keys())[:-520]:
-                    buckets.pop(d, None)
-            except Exception:
-                pass
+        src = getattr(self, kind)
+        buckets = src.buckets
+        buckets[today] = buckets.get(today, 0.0) + delta
+        self._period_cache.pop(kind, None)
+        days = src.days
+        prefix = src.prefix
+        if days and days[-1] == today:
+            prefix[-1] += delta
+        elif not days or days[-1] < today:
+            days.append(today)
+            prefix.append(prefix[-1] + delta)
+        else:
+            # Uhr zurückgestellt: Index komplett neu aufbauen
+            self._reindex(kind)
+        # keep buckets bounded (e.g., 500 days); days arrive in order, so drop from the front.
+        # Prefix sums stay valid as differences, 'overall' subtracts prefix[0].
+        excess = len(src.days) - 520
+        if excess > 0:
+            for _ in range(excess):
+                src.buckets.popitem(last=False)
+            del src.days[:excess]
+            del src.prefix[:excess]
         return True
 
     async def async_load(self):
         if self._loaded:
             return
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self):
         try:
             data = await self._store.async_load()
         except Exception:
@@ -131,33 +248,55 @@ class _EnergyAccumulator:
             try:
                 srcs = data.get('sources') or {}
                 for kind in ('energy', 'heat'):
-                    if kind in srcs:
-                        ksrc = srcs[kind]
-                        # restore buckets
-                        self._sources[kind]['buckets'] = {str(k): float(v) for k, v in (ksrc.get('buckets') or {}).items()}
-                        # restore last to capture offline delta on next update (monotonic meters)
-                        try:
-                            self._sources[kind]['last'] = float(ksrc.get('last')) if ksrc.get('last') is not None else None
-                        except Exception:
-                            self._sources[kind]['last'] = None
+                    ksrc = srcs.get(kind)
+                    if not isinstance(ksrc, dict):
+                        continue
+                    src = getattr(self, kind)
+                    # restore buckets (skip entries that are not "YYYY-MM-DD": number)
+                    parsed = ((_parse_day(k), v) for k, v in (ksrc.get('buckets') or {}).items())
+                    src.buckets = {
+                        d: float(v)
+                        for d, v in parsed
+                        if d is not None and isinstance(v, (int, float))
+                    }
+                    # restore last to capture offline delta on next update (monotonic meters)
+                    try:
+                        src.last = float(ksrc['last'])
+                    except (TypeError, KeyError, ValueError):
+                        src.last = None
                 # If entity ids changed since save, reset last accordingly via reconfigure
                 ent = data.get('entities') or {}
                 self.reconfigure(ent.get('energy', self._entities['energy']), ent.get('heat', self._entities['heat']))
             except Exception:
                 pass
+        for kind in ('energy', 'heat'):
+            self._reindex(kind)
         self._loaded = True
 
+    def _schedule_save(self) -> None:
+        """Coalesce all deltas of the next 30 s into one Store write."""
+        if self._save_handle is None:
+            self._save_handle = async_call_later(self._hass, 30, self._async_delayed_save)
+
+    async def _async_delayed_save(self, _now) -> None:
+        self._save_handle = None
+        await self.async_save()
+
     async def async_save(self):
+        if self._save_handle is not None:
+            # Writing now supersedes the scheduled save
+            self._save_handle()
+            self._save_handle = None
         try:
             payload = {
                 'sources': {
                     'energy': {
-                        'buckets': self._sources['energy']['buckets'],
-                        'last': self._sources['energy']['last'],
+                        'buckets': {d.isoformat(): v for d, v in self.energy.buckets.items()},
+                        'last': self.energy.last,
                     },
                     'heat': {
-                        'buckets': self._sources['heat']['buckets'],
-                        'last': self._sources['heat']['last'],
+                        'buckets': {d.isoformat(): v for d, v in self.heat.buckets.items()},
+                        'last': self.heat.last,
                     },
                 },
                 'entities': dict(self._entities),
@@ -167,64 +306,64 @@ class _EnergyAccumulator:
             pass
 
     async def async_update(self) -> None:
+        # Sensors updating in the same tick cost little: idle meters are skipped
+        # by last_updated below, and only the store load is awaited (shared task)
         if not self._loaded:
             await self.async_load()
-        changed = False
+        changed_kinds = set()
         for kind, ent_id in self._entities.items():
             if not ent_id:
                 continue
             st = self._hass.states.get(ent_id)
-            if not st or st.state in (None, 'unknown', 'unavailable'):
+            if not st or st.state in _BAD:
+                continue
+            if st.last_updated == self._last_seen.get(kind):
+                # Meter idle since the previous update
                 continue
             try:
                 current = float(st.state)
             except Exception:
                 continue
-            last = self._sources[kind]['last']
+            self._last_seen[kind] = st.last_updated
+            src = getattr(self, kind)
+            last = src.last
             if last is None:
-                self._sources[kind]['last'] = current
+                src.last = current
                 continue
             delta = current - last
             if delta < 0:
                 # For monotonic meters: ignore spurious negative deltas, keep last
                 continue
             if self._add_delta(kind, delta):
-                changed = True
-            self._sources[kind]['last'] = current
-        if changed:
-            await self.async_save()
+                changed_kinds.add(kind)
+            src.last = current
+        if changed_kinds:
+            self._schedule_save()
+            async_dispatcher_send(self._hass, SIGNAL_ACC_CHANGED, changed_kinds)
 
     def _sum_days(self, kind: str, days: int) -> float:
-        buckets = self._sources[kind]['buckets']
-        if not buckets:
+        """Sum of the last `days` days including today (bisect + prefix sums)."""
+        src = getattr(self, kind)
+        sorted_days = src.days
+        if not sorted_days:
             return 0.0
-        today = dt_util.now().date()
-        total = 0.0
-        for dstr, val in buckets.items():
-            try:
-                d = date.fromisoformat(dstr)
-            except Exception:
-                continue
-            if (today - d).days < days:
-                total += float(val)
-        return total
+        prefix = src.prefix
+        idx = bisect_left(sorted_days, self._today() - timedelta(days=days - 1))
+        return prefix[-1] - prefix[idx]
 
     def get_value(self, kind: str, period: str):
-        buckets = self._sources[kind]['buckets']
-        if period == 'today':
-            return float(buckets.get(self._today(), 0.0))
-        if period == 'yesterday':
-            y = (dt_util.now().date() - timedelta(days=1)).isoformat()
-            return float(buckets.get(y, 0.0))
-        if period == '7d':
-            return self._sum_days(kind, 7)
-        if period == '30d':
-            return self._sum_days(kind, 30)
-        if period == '365d':
-            return self._sum_days(kind, 365)
-        if period == 'overall':
-            return sum(float(v) for v in buckets.values())
-        return None
+        fn = _PERIOD_DISPATCH.get(period)
+        return fn(self, kind) if fn else None
+
+    def get_all_periods(self, kind: str) -> dict:
+        """All period totals of one source, computed once per delta and day."""
+        today = self._today()
+        cached = self._period_cache.get(kind)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        values = {period: self.get_value(kind, period) for _, period in _PERIODS}
+        self._period_cache[kind] = (today, values)
+        return values
 
     
 
@@ -234,8 +373,8 @@ class _EnergyAccumulator:
 class R290HeatPumpCOPOverallSensor(R290HeatPumpCOPSensorBase):
     """Sensor for overall COP since beginning."""
 
-    def __init__(self, hass, entry, device_info):
-        super().__init__(hass, entry, device_info, "COP Overall", "overall")
+    def __init__(self, hass, entry, device_info, acc=None):
+        super().__init__(hass, entry, device_info, "COP Overall", "overall", acc)
 
     async def async_update(self):
         """Fetch overall COP using in-memory accumulator (no state dependency)."""
@@ -243,7 +382,7 @@ class R290HeatPumpCOPOverallSensor(R290HeatPumpCOPSensorBase):
             if not self._power_meters or not self._heat_meter:
                 self._state = None
                 return
-            acc = self._hass.data.get(DOMAIN, {}).get('_cop_acc')
+            acc = self._acc
             if not acc:
                 self._state = None
                 return
@@ -260,20 +399,18 @@ class R290HeatPumpCOPOverallSensor(R290HeatPumpCOPSensorBase):
 class R290HeatPumpCOPTimeRangeSensor(R290HeatPumpCOPSensorBase):
     """Sensor for COP over a specific time range."""
 
-    def __init__(self, hass, entry, device_info, name, unique_id_suffix, days):
-        super().__init__(hass, entry, device_info, name, unique_id_suffix)
+    __slots__ = ('_days',)
+
+    def __init__(self, hass, entry, device_info, name, unique_id_suffix, days, acc=None):
+        super().__init__(hass, entry, device_info, name, unique_id_suffix, acc)
         self._days = days
 
     async def async_update(self):
         """Fetch COP for the specified time range."""
-        now = datetime.now()
-        start_time = now - timedelta(days=self._days) if self._days > 0 else now.replace(hour=0, minute=0, second=0, microsecond=0)
-        _LOGGER.debug(f"Updating {self._attr_name} for range {start_time} to {now}, power_meters={self._power_meters}, heat_meter={self._heat_meter}")
-
         # Try computing from in-memory accumulator first
         try:
             if self._power_meters and self._heat_meter:
-                acc = self._hass.data.get(DOMAIN, {}).get('_cop_acc')
+                acc = self._acc
                 if acc is not None:
                     try:
                         await acc.async_update()
@@ -299,6 +436,10 @@ class R290HeatPumpCOPTimeRangeSensor(R290HeatPumpCOPSensorBase):
             pass
 
         # Try helper sensors first
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            now = dt_util.now()
+            start_time = now - timedelta(days=self._days) if self._days > 0 else dt_util.start_of_local_day()
+            _LOGGER.debug("Updating %s from helper sensors for range %s to %s, power_meters=%s, heat_meter=%s", self._attr_name, start_time, now, self._power_meters, self._heat_meter)
         try:
             pslug = _slugify(self._power_meters[0]) if self._power_meters else None
             hslug = _slugify(self._heat_meter) if self._heat_meter else None
@@ -322,7 +463,7 @@ class R290HeatPumpCOPTimeRangeSensor(R290HeatPumpCOPSensorBase):
 
             ps = self._hass.states.get(p_id)
             hs = self._hass.states.get(h_id)
-            if ps and hs:
+            if ps is not None and hs is not None and ps.state not in _BAD and hs.state not in _BAD:
                 try:
                     cons = float(ps.state)
                     outp = float(hs.state)
@@ -345,7 +486,7 @@ class R290HeatPumpCOPYesterdaySensor(R290HeatPumpCOPSensorBase):
         try:
             # Prefer in-memory accumulator to avoid state ordering issues
             if self._power_meters and self._heat_meter:
-                acc = self._hass.data.get(DOMAIN, {}).get('_cop_acc')
+                acc = self._acc
                 if acc is not None:
                     try:
                         await acc.async_update()
@@ -365,7 +506,7 @@ class R290HeatPumpCOPYesterdaySensor(R290HeatPumpCOPSensorBase):
             h_id = "sensor.r290_heatpump_heat_yesterday"
             ps = self._hass.states.get(p_id)
             hs = self._hass.states.get(h_id)
-            if not ps or not hs:
+            if ps is None or hs is None or ps.state in _BAD or hs.state in _BAD:
                 self._state = None
                 return
             cons = float(ps.state)
@@ -378,13 +519,26 @@ def setup_cop_sensors(hass, entry, device_info):
     """Set up COP sensors (pure in-memory helpers, no SQL)."""
     heat = entry.data.get("heat_meter")
     power = entry.data.get("power_meter")
+
+    # Create or reuse accumulator to avoid losing buckets on reloads
+    dstore = hass.data.setdefault(DOMAIN, {})
+    acc = dstore.get('_cop_acc')
+    if isinstance(acc, _EnergyAccumulator):
+        try:
+            acc.reconfigure(power, heat)
+        except Exception:
+            pass
+    else:
+        acc = _EnergyAccumulator(hass, power, heat)
+        dstore['_cop_acc'] = acc
+
     sensors = [
-        R290HeatPumpCOPOverallSensor(hass, entry, device_info),
-        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 365 Days", "last_365_days", 365),
-        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 30 Days", "last_30_days", 30),
-        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 7 Days", "last_7_days", 7),
-        R290HeatPumpCOPYesterdaySensor(hass, entry, device_info, "COP Yesterday", "yesterday"),
-        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Today", "today", 0),
+        R290HeatPumpCOPOverallSensor(hass, entry, device_info, acc),
+        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 365 Days", "last_365_days", 365, acc),
+        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 30 Days", "last_30_days", 30, acc),
+        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Last 7 Days", "last_7_days", 7, acc),
+        R290HeatPumpCOPYesterdaySensor(hass, entry, device_info, "COP Yesterday", "yesterday", acc),
+        R290HeatPumpCOPTimeRangeSensor(hass, entry, device_info, "COP Today", "today", 0, acc),
 
     ]
 
@@ -402,6 +556,7 @@ def setup_cop_sensors(hass, entry, device_info):
         start_ts = int(dt_util.now().timestamp())
 
     class _CopAgeSensor(SensorEntity):
+        __slots__ = ('_state',)
         _attr_device_class = None
         _attr_entity_category = EntityCategory.DIAGNOSTIC
         _attr_native_unit_of_measurement = "d"
@@ -426,17 +581,6 @@ def setup_cop_sensors(hass, entry, device_info):
 
     sensors.append(_CopAgeSensor())
 
-    # Create or reuse accumulator to avoid losing buckets on reloads
-    dstore = hass.data.setdefault(DOMAIN, {})
-    acc = dstore.get('_cop_acc')
-    if isinstance(acc, _EnergyAccumulator):
-        try:
-            acc.reconfigure(power, heat)
-        except Exception:
-            pass
-    else:
-        acc = _EnergyAccumulator(hass, power, heat)
-        dstore['_cop_acc'] = acc
     # Ensure state is loaded before first use and persist on shutdown
     async def _ensure_loaded():
         try:
@@ -445,6 +589,7 @@ def setup_cop_sensors(hass, entry, device_info):
             pass
     hass.async_create_task(_ensure_loaded())
     def _on_stop(_):
+        # Final write; also cancels a still pending delayed save
         hass.async_create_task(acc.async_save())
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _on_stop)
 
@@ -457,6 +602,7 @@ def setup_cop_sensors(hass, entry, device_info):
     # No scheduler: we support event-driven updates via sensor changes
 
     class _AccumulatorSensor(SensorEntity):
+        __slots__ = ('_kind', '_period', '_state', '_acc')
         _attr_device_class = None
         _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
         _attr_state_class = 'measurement'
@@ -472,11 +618,22 @@ def setup_cop_sensors(hass, entry, device_info):
             self._period = period
             self._attr_device_info = device_info
             self._state = None
+            self._acc = acc
         @property
         def state(self):
             return self._state
+        async def async_added_to_hass(self):
+            self.async_on_remove(
+                async_dispatcher_connect(self.hass, SIGNAL_ACC_CHANGED, self._on_changed)
+            )
+            # Initial value; HA writes the state right after this
+            self._compute()
+        @callback
+        def _on_changed(self, kinds) -> None:
+            if self._kind in kinds:
+                self.maybe_update()
         async def async_update(self):
-            acc = self.hass.data.get(DOMAIN, {}).get('_cop_acc')
+            acc = self._acc
             if not acc:
                 self._state = None
                 return
@@ -484,27 +641,57 @@ def setup_cop_sensors(hass, entry, device_info):
                 await acc.async_update()
             except Exception:
                 pass
-            val = acc.get_value(self._kind, self._period)
-            self._state = round(float(val), 3) if val is not None else None
-
-    if isinstance(power, str) and power:
-        sensors.extend([
-            _AccumulatorSensor('Energy Overall', f"r290_heatpump_energy_overall_{_slugify(power)}", 'sensor.r290_heatpump_energy_overall', 'energy', 'overall'),
-            _AccumulatorSensor('Energy Today',   f"r290_heatpump_energy_today_{_slugify(power)}",   'sensor.r290_heatpump_energy_today',   'energy', 'today'),
-            _AccumulatorSensor('Energy Yesterday', f"r290_heatpump_energy_yesterday_{_slugify(power)}", 'sensor.r290_heatpump_energy_yesterday', 'energy', 'yesterday'),
-            _AccumulatorSensor('Energy Last 7 Days', f"r290_heatpump_energy_7d_{_slugify(power)}", 'sensor.r290_heatpump_energy_7d', 'energy', '7d'),
-            _AccumulatorSensor('Energy Last 30 Days', f"r290_heatpump_energy_30d_{_slugify(power)}", 'sensor.r290_heatpump_energy_30d', 'energy', '30d'),
-            _AccumulatorSensor('Energy Last 365 Days', f"r290_heatpump_energy_365d_{_slugify(power)}", 'sensor.r290_heatpump_energy_365d', 'energy', '365d'),
-        ])
-    if isinstance(heat, str) and heat:
-        sensors.extend([
-            _AccumulatorSensor('Heat Overall', f"r290_heatpump_heat_overall_{_slugify(heat)}", 'sensor.r290_heatpump_heat_overall', 'heat', 'overall'),
-            _AccumulatorSensor('Heat Today',   f"r290_heatpump_heat_today_{_slugify(heat)}",   'sensor.r290_heatpump_heat_today',   'heat', 'today'),
-            _AccumulatorSensor('Heat Yesterday', f"r290_heatpump_heat_yesterday_{_slugify(heat)}", 'sensor.r290_heatpump_heat_yesterday', 'heat', 'yesterday'),
-            _AccumulatorSensor('Heat Last 7 Days', f"r290_heatpump_heat_7d_{_slugify(heat)}", 'sensor.r290_heatpump_heat_7d', 'heat', '7d'),
-            _AccumulatorSensor('Heat Last 30 Days', f"r290_heatpump_heat_30d_{_slugify(heat)}", 'sensor.r290_heatpump_heat_30d', 'heat', '30d'),
-            _AccumulatorSensor('Heat Last 365 Days', f"r290_heatpump_heat_365d_{_slugify(heat)}", 'sensor.r290_heatpump_heat_365d', 'heat', '365d'),
-        ])
+            self._compute()
+        def _compute(self) -> bool:
+            """Take the current period value from the accumulator; True if it changed."""
+            val = self._acc.get_all_periods(self._kind).get(self._period)
+            new_state = round(float(val), 3) if val is not None else None
+            if new_state == self._state:
+                return False
+            self._state = new_state
+            return True
+        def maybe_update(self) -> None:
+            """Write state only when the (already updated) accumulator moved this value."""
+            if self._acc is not None and self._compute():
+                self.async_write_ha_state()
+
+    class _AccumulatorKindSensor(_AccumulatorSensor):
+        """One entity per kind: 'overall' as state, the other periods as attributes."""
+        __slots__ = ()
+        def __init__(self, name: str, unique_id: str, entity_id: str, kind: str):
+            super().__init__(name, unique_id, entity_id, kind, 'overall')
+        @property
+        def extra_state_attributes(self):
+            if self._acc is None:
+                return None
+            return {
+                period: round(float(val), 3)
+                for period, val in self._acc.get_all_periods(self._kind).items()
+                if period != 'overall' and val is not None
+            }
+
+    # Opt-in: 2 entities instead of 12 (changes entity ids, so not the default)
+    consolidated = bool(entry.options.get("cop_consolidated_sensors", entry.data.get("cop_consolidated_sensors", False)))
+    for kind, label_prefix, src in (('energy', 'Energy', power), ('heat', 'Heat', heat)):
+        if not (isinstance(src, str) and src):
+            continue
+        slug = _slugify(src)
+        if consolidated:
+            sensors.append(_AccumulatorKindSensor(
+                label_prefix,
+                f"r290_heatpump_{kind}_{slug}",
+                f"sensor.r290_heatpump_{kind}",
+                kind,
+            ))
+            continue
+        for label, period in _PERIODS:
+            sensors.append(_AccumulatorSensor(
+                f"{label_prefix} {label}",
+                f"r290_heatpump_{kind}_{period}_{slug}",
+                f"sensor.r290_heatpump_{kind}_{period}",
+                kind,
+                period,
+            ))
     # Configure event-driven triggers based on options
     try:
         trig_heat = bool(entry.options.get("cop_trigger_on_heat", entry.data.get("cop_trigger_on_heat", False)))
@@ -521,24 +708,31 @@ def setup_cop_sensors(hass, entry, device_info):
                 pass
 
         async def _on_source_change(event):
+            # Accumulator once, then only write the sensors whose value moved
             await _acc_update_now()
+            for ent in sensors:
+                if ent.hass is None:
+                    continue
+                if isinstance(ent, _AccumulatorSensor):
+                    # Also the idle kind: today/yesterday roll over at midnight
+                    ent.maybe_update()
+                    continue
+                try:
+                    old = ent.state
+                    await ent.async_update()
+                    if ent.state != old:
+                        ent.async_write_ha_state()
+                except Exception:
+                    pass
+
+        # One subscription for all enabled sources, dropped again on entry unload
+        ids = [x for x, flag in ((power, trig_power), (heat, trig_heat)) if flag and isinstance(x, str) and x]
+        if ids:
             try:
-                for ent in sensors:
-                    ent.async_schedule_update_ha_state(True)
+                entry.async_on_unload(async_track_state_change_event(hass, ids, _on_source_change))
             except Exception:
                 pass
 
-        try:
-            if trig_power and isinstance(power, str) and power:
-                async_track_state_change_event(hass, [power], _on_source_change)
-        except Exception:
-            pass
-        try:
-            if trig_heat and isinstance(heat, str) and heat:
-                async_track_state_change_event(hass, [heat], _on_source_change)
-        except Exception:
-            pass
-
     _LOGGER.debug(f"Created COP sensors: {[s.name for s in sensors]} (event_triggers heat={trig_heat}, power={trig_power})")
     return sensors
 
@@ -3,9 +3,11 @@
 """Register a Lovelace dashboard shipped with the R290 Heat Pump integration."""
 from __future__ import annotations
 
+import hashlib
 import logging
-from functools import partial
+import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -20,6 +22,17 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# lovelace constants bound once at import
+_CONF_TITLE = lovelace_const.CONF_TITLE
+_CONF_ICON = lovelace_const.CONF_ICON
+_CONF_URL_PATH = lovelace_const.CONF_URL_PATH
+_CONF_REQUIRE_ADMIN = lovelace_const.CONF_REQUIRE_ADMIN
+_CONF_SHOW_IN_SIDEBAR = lovelace_const.CONF_SHOW_IN_SIDEBAR
+_CONF_MODE = lovelace_const.CONF_MODE
+_MODE_STORAGE = lovelace_const.MODE_STORAGE
+_LOVELACE_DOMAIN = lovelace_const.DOMAIN
+_LOVELACE_DATA = lovelace_const.LOVELACE_DATA
+
 _LOVELACE_TEMPLATE = Path(__file__).parent / "lovelace_dashboard.yaml"
 _DASHBOARD_DIR = "dashboards"
 _DASHBOARD_FILENAME = "r290_heatpump.yaml"
@@ -27,6 +40,30 @@ _DASHBOARD_URL_PATH = "r290-heatpump"
 _DASHBOARD_TITLE = "R290 Heat Pump"
 _DASHBOARD_ICON = "mdi:heat-wave"
 
+# Dashboard metadata we own; existing items are only updated where they differ
+_BASE_ITEM = MappingProxyType(
+    {
+        _CONF_TITLE: _DASHBOARD_TITLE,
+        _CONF_ICON: _DASHBOARD_ICON,
+        _CONF_URL_PATH: _DASHBOARD_URL_PATH,
+        _CONF_REQUIRE_ADMIN: False,
+        _CONF_SHOW_IN_SIDEBAR: True,
+    }
+)
+_DIFF_KEYS = (
+    _CONF_TITLE,
+    _CONF_ICON,
+    _CONF_SHOW_IN_SIDEBAR,
+    _CONF_REQUIRE_ADMIN,
+)
+
+# libyaml-backed loader when available (same safe tag set as SafeLoader)
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# blake2b digest of the template bytes -> parsed config; survives entry reloads.
+# The dict is shared between callers and must not be mutated.
+_PARSED_CACHE: dict[bytes, dict[str, Any]] = {}
+
 
 async def async_setup_dashboard(hass: HomeAssistant) -> None:
     """Ensure the packaged Lovelace dashboard is available in Home Assistant."""
@@ -34,14 +71,8 @@ async def async_setup_dashboard(hass: HomeAssistant) -> None:
     if domain_data.get("_dashboard_ready"):
         return
 
-    template_text = await _read_template(hass)
-    if template_text is None:
-        return
-
-    if await _synchronize_packaged_file(hass, template_text) is None:
-        return
-
-    template_config = await _parse_lovelace_config(hass, template_text)
+    target_path = Path(hass.config.path(_DASHBOARD_DIR)) / _DASHBOARD_FILENAME
+    template_config = await hass.async_add_executor_job(_bootstrap, _LOVELACE_TEMPLATE, target_path)
     if template_config is None:
         return
 
@@ -50,82 +81,79 @@ async def async_setup_dashboard(hass: HomeAssistant) -> None:
         if success:
             domain_data["_dashboard_ready"] = True
 
-    if lovelace_const.DOMAIN in hass.config.components:
+    if _LOVELACE_DOMAIN in hass.config.components:
         await _finalize_setup()
         return
 
     @callback
     def _on_component_loaded(event) -> None:
-        if event.data.get("component") != lovelace_const.DOMAIN:
-            return
         unsubscribe()
         hass.async_create_task(_finalize_setup())
 
-    unsubscribe = hass.bus.async_listen(EVENT_COMPONENT_LOADED, _on_component_loaded)
+    unsubscribe = hass.bus.async_listen(
+        EVENT_COMPONENT_LOADED, _on_component_loaded, event_filter=_is_lovelace_loaded
+    )
 
 
-def _read_text_with_encoding(path: Path, encoding: str) -> str:
-    return path.read_text(encoding=encoding)
+@callback
+def _is_lovelace_loaded(event_data) -> bool:
+    """Bus filter: only the lovelace component-loaded event reaches the listener."""
+    return event_data.get("component") == _LOVELACE_DOMAIN
 
 
-async def _read_template(hass: HomeAssistant) -> str | None:
-    if not _LOVELACE_TEMPLATE.is_file():
-        _LOGGER.warning(
-            "Dashboard template missing at %s; skipping dashboard creation",
-            _LOVELACE_TEMPLATE,
-        )
-        return None
+def _read_bytes(path: Path) -> bytes:
+    """Read the template as UTF-8 bytes (executor job).
 
+    A cp1252-encoded template is converted once and written back as UTF-8.
+    """
+    data = path.read_bytes()
     try:
-        return await hass.async_add_executor_job(
-            _read_text_with_encoding,
-            _LOVELACE_TEMPLATE,
-            "utf-8",
-        )
+        data.decode("utf-8")
     except UnicodeDecodeError:
-        template_text = await hass.async_add_executor_job(
-            _read_text_with_encoding,
-            _LOVELACE_TEMPLATE,
-            "cp1252",
-        )
-        await hass.async_add_executor_job(
-            _LOVELACE_TEMPLATE.write_text,
-            template_text,
-            "utf-8",
-        )
-        return template_text
-    except Exception as err:  # pragma: no cover - filesystem error
-        _LOGGER.error("Failed to read packaged dashboard template: %s", err)
-        return None
+        data = data.decode("cp1252").encode("utf-8")
+        _atomic_write(path, data)
+    return data
 
 
-async def _synchronize_packaged_file(hass: HomeAssistant, template_text: str) -> Path | None:
-    dashboards_path = Path(hass.config.path(_DASHBOARD_DIR))
-    try:
-        await hass.async_add_executor_job(dashboards_path.mkdir, 0o777, True, True)
-    except Exception as err:  # pragma: no cover - filesystem error
-        _LOGGER.error("Failed to prepare dashboards directory %s: %s", dashboards_path, err)
-        return None
+def _file_digest(path: Path) -> bytes:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "blake2b").digest()
 
-    target_path = dashboards_path / _DASHBOARD_FILENAME
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write `data` to a temp file with a single fsync, then rename over `path`."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        needs_write = not await hass.async_add_executor_job(target_path.exists)
-        if not needs_write:
-            existing = await hass.async_add_executor_job(target_path.read_text, "utf-8")
-            needs_write = existing != template_text
-        if needs_write:
-            await hass.async_add_executor_job(target_path.write_text, template_text, "utf-8")
-            _LOGGER.debug("Synchronized Lovelace dashboard file at %s", target_path)
-    except Exception as err:  # pragma: no cover - filesystem error
-        _LOGGER.error("Failed to synchronize dashboard file %s: %s", target_path, err)
-        return None
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _sync_file(path: Path, data: bytes, digest: bytes) -> bool:
+    """Make `path` contain `data` (executor job); return True if it was written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Size first, content only when the size already matches
+        if os.stat(path).st_size == len(data) and _file_digest(path) == digest:
+            return False
+    except FileNotFoundError:
+        pass
+    _atomic_write(path, data)
+    return True
 
-    return target_path
 
+def _parse_template(template: bytes, digest: bytes) -> dict[str, Any] | None:
+    cached = _PARSED_CACHE.get(digest)
+    if cached is not None:
+        return cached
 
-async def _parse_lovelace_config(hass: HomeAssistant, template_text: str) -> dict[str, Any] | None:
     try:
-        data = await hass.async_add_executor_job(partial(yaml.safe_load, template_text))
+        data = yaml.load(template, Loader=_LOADER)
     except Exception as err:  # pragma: no cover - yaml error
         _LOGGER.error("Failed to parse Lovelace template: %s", err)
         return None
@@ -135,61 +163,75 @@ async def _parse_lovelace_config(hass: HomeAssistant, template_text: str) -> dic
         return None
 
     data.setdefault("views", [])
+    # Only the current template version is worth keeping
+    _PARSED_CACHE.clear()
+    _PARSED_CACHE[digest] = data
     return data
 
 
-async def _register_storage_dashboard(
-    hass: HomeAssistant,
-    template_config: dict[str, Any],
-) -> bool:
-    lovelace_data = hass.data.get(lovelace_const.LOVELACE_DATA)
-    if lovelace_data is None:
-        _LOGGER.warning("Lovelace not fully initialized; dashboard registration postponed")
-        return False
+def _bootstrap(template_path: Path, target_path: Path) -> dict[str, Any] | None:
+    """Read, synchronize and parse the packaged template in one executor job."""
+    if not template_path.is_file():
+        _LOGGER.warning(
+            "Dashboard template missing at %s; skipping dashboard creation",
+            template_path,
+        )
+        return None
+
+    try:
+        template = _read_bytes(template_path)
+    except Exception as err:  # pragma: no cover - filesystem error
+        _LOGGER.error("Failed to read packaged dashboard template: %s", err)
+        return None
+
+    # One digest of the template serves the file sync and the parse cache
+    digest = hashlib.blake2b(template).digest()
+
+    try:
+        if _sync_file(target_path, template, digest):
+            _LOGGER.debug("Synchronized Lovelace dashboard file at %s", target_path)
+    except Exception as err:  # pragma: no cover - filesystem error
+        _LOGGER.error("Failed to synchronize dashboard file %s: %s", target_path, err)
+        return None
+
+    return _parse_template(template, digest)
+
 
+def _metadata_current(config: dict[str, Any] | None) -> bool:
+    """True if a dashboard config already carries our title/icon/sidebar settings."""
+    config = config or {}
+    return all(config.get(k) == _BASE_ITEM[k] for k in _DIFF_KEYS)
+
+
+async def _async_upsert_dashboard_item(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Create or update our item in the dashboards collection (storage read)."""
     dashboards_collection = lovelace_dashboard.DashboardsCollection(hass)
     try:
         await dashboards_collection.async_load()
     except Exception as err:  # pragma: no cover - storage error
         _LOGGER.error("Failed to load Lovelace dashboards collection: %s", err)
-        return False
+        return None
 
     existing_id: str | None = None
     existing_item: dict[str, Any] | None = None
     for item_id, item in dashboards_collection.data.items():
-        if item.get(lovelace_const.CONF_URL_PATH) == _DASHBOARD_URL_PATH:
+        if item.get(_CONF_URL_PATH) == _DASHBOARD_URL_PATH:
             existing_id = item_id
             existing_item = item
             break
 
-    base_item: dict[str, Any] = {
-        lovelace_const.CONF_TITLE: _DASHBOARD_TITLE,
-        lovelace_const.CONF_ICON: _DASHBOARD_ICON,
-        lovelace_const.CONF_URL_PATH: _DASHBOARD_URL_PATH,
-        lovelace_const.CONF_REQUIRE_ADMIN: False,
-        lovelace_const.CONF_SHOW_IN_SIDEBAR: True,
-    }
-
     item: dict[str, Any]
     if existing_item is None:
         _LOGGER.info("Creating storage-backed Lovelace dashboard '%s'", _DASHBOARD_URL_PATH)
         try:
             item = await dashboards_collection.async_create_item(
-                {**base_item, lovelace_const.CONF_MODE: lovelace_const.MODE_STORAGE}
+                {**_BASE_ITEM, _CONF_MODE: _MODE_STORAGE}
             )
         except Exception as err:  # pragma: no cover - runtime safety
             _LOGGER.error("Failed to create Lovelace dashboard metadata: %s", err)
-            return False
+            return None
     else:
-        updates = {}
-        for key, value in (
-            (lovelace_const.CONF_TITLE, _DASHBOARD_TITLE),
-            (lovelace_const.CONF_ICON, _DASHBOARD_ICON),
-            (lovelace_const.CONF_SHOW_IN_SIDEBAR, True),
-            (lovelace_const.CONF_REQUIRE_ADMIN, False),
-        ):
-            if existing_item.get(key) != value:
-                updates[key] = value
+        updates = {k: _BASE_ITEM[k] for k in _DIFF_KEYS if existing_item.get(k) != _BASE_ITEM[k]}
 
         if updates:
             _LOGGER.info("Updating Lovelace dashboard metadata for '%s'", _DASHBOARD_URL_PATH)
@@ -200,13 +242,32 @@ async def _register_storage_dashboard(
                 item = existing_item
         else:
             item = existing_item
+    return item
+
+
+async def _register_storage_dashboard(
+    hass: HomeAssistant,
+    template_config: dict[str, Any],
+) -> bool:
+    lovelace_data = hass.data.get(_LOVELACE_DATA)
+    if lovelace_data is None:
+        _LOGGER.warning("Lovelace not fully initialized; dashboard registration postponed")
+        return False
 
     lovelace_config = lovelace_data.dashboards.get(_DASHBOARD_URL_PATH)
-    if not isinstance(lovelace_config, lovelace_dashboard.LovelaceStorage):
-        lovelace_config = lovelace_dashboard.LovelaceStorage(hass, item)
-        lovelace_data.dashboards[_DASHBOARD_URL_PATH] = lovelace_config
-    else:
-        lovelace_config.config = {**item, lovelace_const.CONF_URL_PATH: _DASHBOARD_URL_PATH}
+    if not (
+        isinstance(lovelace_config, lovelace_dashboard.LovelaceStorage)
+        and _metadata_current(lovelace_config.config)
+    ):
+        # Not known in memory (or outdated): go through the dashboards store
+        item = await _async_upsert_dashboard_item(hass)
+        if item is None:
+            return False
+        if not isinstance(lovelace_config, lovelace_dashboard.LovelaceStorage):
+            lovelace_config = lovelace_dashboard.LovelaceStorage(hass, item)
+            lovelace_data.dashboards[_DASHBOARD_URL_PATH] = lovelace_config
+        else:
+            lovelace_config.config = {**item, _CONF_URL_PATH: _DASHBOARD_URL_PATH}
 
     try:
         await lovelace_config.async_save(template_config)
@@ -216,7 +277,7 @@ async def _register_storage_dashboard(
 
     frontend.async_register_built_in_panel(
         hass,
-        lovelace_const.DOMAIN,
+        _LOVELACE_DOMAIN,
         frontend_url_path=_DASHBOARD_URL_PATH,
         sidebar_title=_DASHBOARD_TITLE,
         sidebar_icon=_DASHBOARD_ICON,
@@ -230,8 +291,9 @@ async def _register_storage_dashboard(
 async def async_remove_dashboard(hass: HomeAssistant) -> None:
     """Remove the Lovelace dashboard for the integration."""
     hass.data.setdefault(DOMAIN, {}).pop("_dashboard_ready", None)
-    lovelace_data = hass.data.get(lovelace_const.LOVELACE_DATA)
-    if lovelace_data is not None:
+    lovelace_data = hass.data.get(_LOVELACE_DATA)
+    # Lovelace indexes every collection dashboard in memory; no entry, nothing stored
+    if lovelace_data is not None and _DASHBOARD_URL_PATH in lovelace_data.dashboards:
         dashboards_collection = lovelace_dashboard.DashboardsCollection(hass)
         try:
             await dashboards_collection.async_load()
@@ -239,7 +301,7 @@ async def async_remove_dashboard(hass: HomeAssistant) -> None:
             _LOGGER.warning("Failed to load Lovelace dashboards collection for removal: %s", err)
         else:
             for item_id, item in list(dashboards_collection.data.items()):
-                if item.get(lovelace_const.CONF_URL_PATH) == _DASHBOARD_URL_PATH:
+                if item.get(_CONF_URL_PATH) == _DASHBOARD_URL_PATH:
                     try:
                         await dashboards_collection.async_delete_item(item_id)
                     except Exception as err:  # pragma: no cover - storage error
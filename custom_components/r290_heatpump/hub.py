@@ -1,8 +1,11 @@
 # Version: 1.0.1
 # Last modified: 2025-10-24 17:33 by CNC-Buddy
 import asyncio
+import inspect
 import logging
-from typing import Optional, Dict, List, Set
+import socket
+import time
+from typing import Awaitable, Callable, Optional, Dict, List, Set, Tuple
 from datetime import timedelta
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -34,10 +37,55 @@ except Exception:  # pragma: no cover - fallback for other pymodbus variants
 
 _LOGGER = logging.getLogger(__name__)
 
+# Framer per connection mode, resolved once for the installed pymodbus variant
+if _FRAMER_STYLE == "type":
+    _RTU_FRAMER = FramerType.RTU
+    _SOCKET_FRAMER = FramerType.SOCKET
+elif _FRAMER_STYLE == "class":
+    _RTU_FRAMER = ModbusRtuFramer
+    _SOCKET_FRAMER = ModbusSocketFramer
+else:
+    _RTU_FRAMER = _SOCKET_FRAMER = None
+
+
+def _call_spec(func: Callable, value_kw: str) -> Tuple[bool, Optional[str]]:
+    """Inspect a pymodbus request method once: (pass value by keyword, unit keyword)."""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False, None
+    unit_kw = next((kw for kw in ("unit", "slave", "device_id") if kw in params), None)
+    if unit_kw is None and any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        # Older clients take the unit through **kwargs
+        unit_kw = "unit"
+    return value_kw in params, unit_kw
+
+
+def _plan_blocks(addresses: List[int], max_count: int, max_gap: int = 0) -> List[Tuple[int, int]]:
+    """Merge sorted register addresses into (start, count) blocks.
+
+    Up to max_gap unused registers between two addresses are read along
+    instead of starting a new request (keep 0 for writes).
+    """
+    blocks: List[Tuple[int, int]] = []
+    i = 0
+    while i < len(addresses):
+        start = addresses[i]
+        end = start
+        j = i + 1
+        while j < len(addresses) and addresses[j] - end <= max_gap + 1 and (addresses[j] - start + 1) <= max_count:
+            end = addresses[j]
+            j += 1
+        blocks.append((start, end - start + 1))
+        i = j
+    return blocks
+
 
 class _ResultWrapper:
     """Wrapper for Modbus results or errors."""
 
+    __slots__ = ("registers", "_error")
+
     def __init__(self, registers=None, error: Optional[Exception] = None):
         self.registers = registers or []
         self._error = error
@@ -51,6 +99,10 @@ class _ResultWrapper:
         return f"Result(registers={self.registers})"
 
 
+# Shared successful result without registers; treat as read-only
+_EMPTY_OK = _ResultWrapper()
+
+
 class R290HeatPumpModbusHub:
     """Async Modbus hub with robust unit/slave handling."""
 
@@ -74,45 +126,115 @@ class R290HeatPumpModbusHub:
         connect_timeout: float = 8.0,  # seconds
         connect_retries: int = 2,
         request_timeout: float = 5.0,  # seconds
+        tcp_nodelay: bool = True,
+        tcp_quickack: bool = True,
+        so_keepalive: bool = True,
     ):
         self._host = host
         self._port = port
         self._mode = mode
         self._client: Optional[AsyncModbusTcpClient] = None
+        # One request at a time: the unit id is set on shared client state before each call
         self._lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
         self._connect_timeout = float(connect_timeout)
         self._connect_retries = int(connect_retries)
         self._request_timeout = float(request_timeout)
+        # method name -> _call_spec() result, valid for the current client only
+        self._call_specs: Dict[str, Tuple[bool, Optional[str]]] = {}
+        # (target, attribute) pairs that carry the unit id, built once per client
+        self._unit_setters: Optional[List[Tuple[object, str]]] = None
+        # Object the requests are issued on (client.protocol or the client), set on connect
+        self._base: Optional[object] = None
+        self._sock_opts: List[Tuple[int, int]] = []
+        if tcp_nodelay:
+            self._sock_opts.append((socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        if tcp_quickack and hasattr(socket, "TCP_QUICKACK"):  # Linux only
+            self._sock_opts.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK))
+        if so_keepalive:
+            self._sock_opts.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+        # Monotonic timestamp of the last successful connect or transaction
+        self.last_ok_ts = 0.0
+
+    def is_healthy(self, max_age: float = 5.0) -> bool:
+        """Return True if the client is connected and answered recently."""
+        if self._client is None or not getattr(self._client, "connected", False):
+            return False
+        return time.monotonic() - self.last_ok_ts < max_age
+
+    @property
+    def request_lock(self) -> asyncio.Lock:
+        """Lock guarding a single in-flight Modbus request/response."""
+        return self._lock
+
+    def _tune_socket(self) -> None:
+        """Apply the configured socket options (Nagle off, quick ACK, keepalive)."""
+        if not self._sock_opts:
+            return
+        client = self._client
+        transport = None
+        for holder in (getattr(client, "ctx", None), client):
+            transport = getattr(holder, "transport", None)
+            if transport is not None:
+                break
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            return
+        for level, opt in self._sock_opts:
+            try:
+                sock.setsockopt(level, opt, 1)
+            except OSError as err:
+                _LOGGER.debug("Could not set socket option %s: %s", opt, err)
+
+    def _build_unit_setters(self, base: object) -> List[Tuple[object, str]]:
+        """Collect every client/protocol attribute that holds the unit/slave id."""
+        setters: List[Tuple[object, str]] = []
+        seen: List[object] = []
+
+        def _collect(target: object) -> None:
+            if target is None or target in seen:
+                return
+            seen.append(target)
+            setters.extend((target, attr) for attr in self._UNIT_ATTR_CANDIDATES if hasattr(target, attr))
+
+        for target in (base, getattr(base, "protocol", None), self._client):
+            _collect(target)
+            if target is not None:
+                for attr_name in ("defaults", "params"):
+                    _collect(getattr(target, attr_name, None))
+        return setters
 
     def _apply_unit(self, base: object, unit: Optional[int]) -> None:
         """Propagate unit/slave id to client/protocol objects."""
         if unit is None:
             return
-        seen: List[object] = []
-        for target in (base, getattr(base, "protocol", None), self._client):
-            if target is None or target in seen:
-                continue
-            seen.append(target)
-            for attr in self._UNIT_ATTR_CANDIDATES:
-                if hasattr(target, attr):
-                    try:
-                        setattr(target, attr, unit)
-                    except Exception:
-                        pass
-            for attr_name in ("defaults", "params"):
-                sub_target = getattr(target, attr_name, None)
-                if sub_target is None or sub_target in seen:
-                    continue
-                seen.append(sub_target)
-                for attr in self._UNIT_ATTR_CANDIDATES:
-                    if hasattr(sub_target, attr):
-                        try:
-                            setattr(sub_target, attr, unit)
-                        except Exception:
-                            pass
+        if self._unit_setters is None:
+            self._unit_setters = self._build_unit_setters(base)
+        for target, attr in self._unit_setters:
+            try:
+                setattr(target, attr, unit)
+            except Exception:
+                pass
+
+    async def _invoke(self, base: object, method: str, value_kw: str, address: int, value, unit: Optional[int]):
+        """Call base.<method> with the argument layout detected for this client."""
+        func = getattr(base, method)
+        spec = self._call_specs.get(method)
+        if spec is None:
+            spec = self._call_specs[method] = _call_spec(func, value_kw)
+        by_kw, unit_kw = spec
+        kwargs = {unit_kw: unit} if unit_kw is not None and unit is not None else {}
+        if by_kw:
+            kwargs[value_kw] = value
+            return await func(address, **kwargs)
+        return await func(address, value, **kwargs)
 
     async def async_connect(self) -> None:
         """Ensure a connected client exists."""
+        async with self._connect_lock:
+            await self._async_connect()
+
+    async def _async_connect(self) -> None:
         if self._client is not None:
             try:
                 if getattr(self._client, "connected", False):
@@ -122,66 +244,59 @@ class R290HeatPumpModbusHub:
                 pass
             self._client = None
 
-        primary_framer = None
-        if _FRAMER_STYLE == "type":
-            primary_framer = FramerType.RTU if self._mode == "rtuovertcp" else FramerType.SOCKET
-        elif _FRAMER_STYLE == "class":
-            primary_framer = ModbusRtuFramer if self._mode == "rtuovertcp" else ModbusSocketFramer
-
-        framer_candidates = []
-        if primary_framer is not None:
-            framer_candidates.append(primary_framer)
-        framer_candidates.append(None)
+        fr = _RTU_FRAMER if self._mode == "rtuovertcp" else _SOCKET_FRAMER
+        # New client, new method signatures and unit attributes
+        self._call_specs = {}
+        self._unit_setters = None
+        self._base = None
 
         last_err: Optional[Exception] = None
-        for fr in framer_candidates:
-            for attempt in range(self._connect_retries + 1):
-                try:
-                    self._client = AsyncModbusTcpClient(
-                        self._host,
-                        port=self._port,
-                        framer=fr,  # type: ignore[arg-type]
-                        timeout=self._request_timeout,
-                    )
-                except Exception:
-                    self._client = AsyncModbusTcpClient(
-                        self._host,
-                        port=self._port,
-                        framer=fr,  # type: ignore[arg-type]
-                    )
-                _LOGGER.info(
-                    "Connecting Modbus client %s:%s mode=%s framer=%s (attempt %s)",
+        for attempt in range(self._connect_retries + 1):
+            try:
+                self._client = AsyncModbusTcpClient(
                     self._host,
-                    self._port,
-                    self._mode,
-                    getattr(fr, "__name__", str(fr)),
-                    attempt + 1,
+                    port=self._port,
+                    framer=fr,  # type: ignore[arg-type]
+                    timeout=self._request_timeout,
                 )
+            except Exception:
+                self._client = AsyncModbusTcpClient(
+                    self._host,
+                    port=self._port,
+                    framer=fr,  # type: ignore[arg-type]
+                )
+            _LOGGER.info(
+                "Connecting Modbus client %s:%s mode=%s framer=%s (attempt %s)",
+                self._host,
+                self._port,
+                self._mode,
+                getattr(fr, "__name__", str(fr)),
+                attempt + 1,
+            )
 
+            ok = False
+            try:
+                ret = await asyncio.wait_for(self._client.connect(), timeout=self._connect_timeout)
+                ok = bool(ret) or bool(getattr(self._client, "connected", False))
+            except Exception as err:
+                last_err = err
                 ok = False
-                try:
-                    ret = await self._client.connect()
-                    ok = bool(ret) if ret is not None else bool(getattr(self._client, "connected", False))
-                    if not ok:
-                        deadline = asyncio.get_running_loop().time() + self._connect_timeout
-                        while asyncio.get_running_loop().time() < deadline:
-                            await asyncio.sleep(0.2)
-                            if getattr(self._client, "connected", False):
-                                ok = True
-                                break
-                except Exception as err:
-                    last_err = err
-                    ok = False
 
-                if ok:
-                    return
+            if ok:
+                self._tune_socket()
+                self._base = getattr(self._client, "protocol", self._client)
+                self._unit_setters = self._build_unit_setters(self._base)
+                self.last_ok_ts = time.monotonic()
+                return
 
-                try:
-                    await self._client.close()
-                except Exception:
-                    pass
-                self._client = None
-                await asyncio.sleep(0.8)
+            try:
+                await self._client.close()
+            except Exception:
+                pass
+            self._client = None
+            if attempt < self._connect_retries:
+                # Exponential back-off (0.1 s, 0.2 s, ...), none after the last attempt
+                await asyncio.sleep(0.1 * (2 ** attempt))
 
         raise ConnectionError(
             f"Failed to connect {self._host}:{self._port} mode={self._mode}; last_err={last_err}"
@@ -196,6 +311,8 @@ class R290HeatPumpModbusHub:
             pass
         finally:
             self._client = None
+            self._base = None
+            self._unit_setters = None
 
     async def async_pb_call(self, unit: int, address: int, count: int, kind: str) -> _ResultWrapper:
         """Unified Modbus read/write call with extensive fallbacks."""
@@ -209,70 +326,35 @@ class R290HeatPumpModbusHub:
             return _ResultWrapper(error=RuntimeError("Client not available"))
 
         async with self._lock:
-            try:
-                base = getattr(self._client, "protocol", self._client)
-                unit_id = int(unit) if unit is not None else None
-
-                if kind == "holding":
-                    self._apply_unit(base, unit_id)
-                    call_variants = (
-                        ((address,), {"count": count, "unit": unit_id}),
-                        ((address,), {"count": count, "slave": unit_id}),
-                        ((address,), {"count": count, "device_id": unit_id}),
-                        ((address,), {"count": count}),
-                        ((address, count), {"unit": unit_id}),
-                        ((address, count), {"slave": unit_id}),
-                        ((address, count), {"device_id": unit_id}),
-                        ((address, count), {}),
-                    )
-                    result = None
-                    last_err: Optional[Exception] = None
-                    for args, kwargs in call_variants:
-                        try:
-                            result = await base.read_holding_registers(*args, **kwargs)
-                            break
-                        except TypeError as err:
-                            last_err = err
-                            continue
-                    if result is None:
-                        raise last_err or TypeError("No compatible read_holding_registers signature")
-                    if hasattr(result, "isError") and result.isError():
-                        return _ResultWrapper(error=Exception(str(result)))
-                    regs = getattr(result, "registers", None)
-                    return _ResultWrapper(registers=regs or [])
-
-                if kind == "write_register":
-                    self._apply_unit(base, unit_id)
-                    call_variants = (
-                        ((address,), {"value": count, "unit": unit_id}),
-                        ((address,), {"value": count, "slave": unit_id}),
-                        ((address,), {"value": count, "device_id": unit_id}),
-                        ((address,), {"value": count}),
-                        ((address, count), {"unit": unit_id}),
-                        ((address, count), {"slave": unit_id}),
-                        ((address, count), {"device_id": unit_id}),
-                        ((address, count), {}),
-                    )
-                    result = None
-                    last_err = None
-                    for args, kwargs in call_variants:
-                        try:
-                            result = await base.write_register(*args, **kwargs)
-                            break
-                        except TypeError as err:
-                            last_err = err
-                            continue
-                    if result is None:
-                        raise last_err or TypeError("No suitable write_register signature")
-                    if hasattr(result, "isError") and result.isError():
-                        return _ResultWrapper(error=Exception(str(result)))
-                    return _ResultWrapper(registers=[count])
-
-                return _ResultWrapper(error=ValueError(f"Unsupported kind: {kind}"))
+            return await self._async_pb_call(unit, address, count, kind)
 
-            except Exception as err:
-                _LOGGER.debug("Modbus call failed: %s", err)
-                return _ResultWrapper(error=err)
+    async def _async_pb_call(self, unit: int, address: int, count: int, kind: str) -> _ResultWrapper:
+        try:
+            base = self._base if self._base is not None else getattr(self._client, "protocol", self._client)
+            unit_id = int(unit) if unit is not None else None
+
+            if kind == "holding":
+                self._apply_unit(base, unit_id)
+                result = await self._invoke(base, "read_holding_registers", "count", address, count, unit_id)
+                if hasattr(result, "isError") and result.isError():
+                    return _ResultWrapper(error=Exception(str(result)))
+                regs = getattr(result, "registers", None)
+                self.last_ok_ts = time.monotonic()
+                return _ResultWrapper(registers=regs) if regs else _EMPTY_OK
+
+            if kind == "write_register":
+                self._apply_unit(base, unit_id)
+                result = await self._invoke(base, "write_register", "value", address, count, unit_id)
+                if hasattr(result, "isError") and result.isError():
+                    return _ResultWrapper(error=Exception(str(result)))
+                self.last_ok_ts = time.monotonic()
+                return _ResultWrapper(registers=[count])
+
+            return _ResultWrapper(error=ValueError(f"Unsupported kind: {kind}"))
+
+        except Exception as err:
+            _LOGGER.debug("Modbus call failed: %s", err)
+            return _ResultWrapper(error=err)
 
     async def async_pb_write_register(self, unit: int, address: int, value: int, kind: str = "holding") -> None:
         if self._client is None:
@@ -281,31 +363,30 @@ class R290HeatPumpModbusHub:
             raise RuntimeError("Client not available")
 
         async with self._lock:
-            base = getattr(self._client, "protocol", self._client)
+            base = self._base if self._base is not None else getattr(self._client, "protocol", self._client)
             unit_id = int(unit) if unit is not None else None
             self._apply_unit(base, unit_id)
-            call_variants = (
-                ((address,), {"value": value, "unit": unit_id}),
-                ((address,), {"value": value, "slave": unit_id}),
-                ((address,), {"value": value, "device_id": unit_id}),
-                ((address,), {"value": value}),
-                ((address, value), {"unit": unit_id}),
-                ((address, value), {"slave": unit_id}),
-                ((address, value), {"device_id": unit_id}),
-                ((address, value), {}),
-            )
-            last_err: Optional[Exception] = None
-            for args, kwargs in call_variants:
-                try:
-                    result = await base.write_register(*args, **kwargs)
-                    if hasattr(result, "isError") and result.isError():
-                        raise Exception(str(result))
-                    return
-                except TypeError as err:
-                    last_err = err
-                    continue
-            if last_err:
-                raise last_err
+            result = await self._invoke(base, "write_register", "value", address, value, unit_id)
+            if hasattr(result, "isError") and result.isError():
+                raise Exception(str(result))
+            self.last_ok_ts = time.monotonic()
+
+    async def async_pb_write_registers(self, unit: int, address: int, values: List[int]) -> None:
+        """Write contiguous holding registers in a single FC16 request."""
+        if self._client is None:
+            await self.async_connect()
+        if self._client is None:
+            raise RuntimeError("Client not available")
+
+        async with self._lock:
+            base = self._base if self._base is not None else getattr(self._client, "protocol", self._client)
+            unit_id = int(unit) if unit is not None else None
+            self._apply_unit(base, unit_id)
+            values = [int(v) for v in values]
+            result = await self._invoke(base, "write_registers", "values", address, values, unit_id)
+            if hasattr(result, "isError") and result.isError():
+                raise Exception(str(result))
+            self.last_ok_ts = time.monotonic()
 
     async def async_read_block(self, unit: int, start: int, count: int) -> List[int]:
         res = await self.async_pb_call(unit, start, count, "holding")
@@ -314,6 +395,17 @@ class R290HeatPumpModbusHub:
         return res.registers
 
 
+def _resolve_waiters(waiters: List[asyncio.Future], err: Optional[Exception]) -> None:
+    """Finish the futures of one buffered write with its outcome."""
+    for fut in waiters:
+        if fut.done():
+            continue
+        if err is None:
+            fut.set_result(None)
+        else:
+            fut.set_exception(err)
+
+
 class ModbusBatchCoordinator(DataUpdateCoordinator[Dict[int, int]]):
     """Coordinate batched reads per unit and interval."""
 
@@ -326,6 +418,8 @@ class ModbusBatchCoordinator(DataUpdateCoordinator[Dict[int, int]]):
         *,
         block_size: int = 20,
         block_pause: float = 0.1,  # seconds
+        max_gap: int = 0,
+        read_block: Optional[Callable[[int, int], Awaitable[List[int]]]] = None,
     ):
         super().__init__(
             hass,
@@ -336,41 +430,96 @@ class ModbusBatchCoordinator(DataUpdateCoordinator[Dict[int, int]]):
         self._hub = hub
         self._unit = unit
         self._addresses: Set[int] = set()
+        # Block plan for the current address set; rebuilt only after it changes
+        self._plan: Optional[List[Tuple[int, int]]] = None
+        # A refresh for newly added addresses is already scheduled
+        self._refresh_pending = False
         self.data: Dict[int, int] = {}
         self._max_count = max(1, min(125, int(block_size)))
-        self._pause = max(0.0, float(block_pause))
+        # Minimum spacing between request starts; only the remainder after a read is slept
+        self._min_gap = max(0.0, float(block_pause))
+        # Smoothed block response time (seconds), for diagnostics
+        self.rtt_ewma: Optional[float] = None
+        # Unused registers bridged per block; a few extra words are cheaper than another
+        # round trip, but only if the device implements them (0 = no bridging)
+        self._max_gap = max(0, int(max_gap))
+        self._read_block = read_block or self._read_direct
+
+    async def _read_direct(self, start: int, count: int) -> List[int]:
+        return await self._hub.async_read_block(self._unit, start, count)
 
     def add_addresses(self, addrs: List[int]) -> None:
         before = len(self._addresses)
         self._addresses.update(addrs)
         after = len(self._addresses)
-        if after > before and self.last_update_success is not None:
-            self.async_set_updated_data(self.data)
+        if after <= before:
+            return
+        self._plan = None
+        # Before the first poll the initial refresh picks the new addresses up.
+        # Afterwards, registrations arriving in a burst share one refresh.
+        if self.data and not self._refresh_pending:
+            self._refresh_pending = True
+            self.hass.loop.call_later(
+                0.1, lambda: self.hass.async_create_task(self.async_request_refresh())
+            )
+
+    def block_plan(self) -> List[Tuple[int, int]]:
+        """Return the (start, count) blocks read on each update."""
+        if self._plan is None:
+            self._plan = _plan_blocks(sorted(self._addresses), self._max_count, self._max_gap)
+        return self._plan
 
     async def _async_update_data(self) -> Dict[int, int]:
+        self._refresh_pending = False
         if not self._addresses:
             return {}
-        addresses = sorted(self._addresses)
         result: Dict[int, int] = {}
-        i = 0
-        while i < len(addresses):
-            start = addresses[i]
-            end = start
-            j = i + 1
-            while j < len(addresses) and addresses[j] == end + 1 and (addresses[j] - start + 1) <= self._max_count:
-                end = addresses[j]
-                j += 1
-            count = end - start + 1
+        wanted = self._addresses
+        loop = self.hass.loop
+        plan = self.block_plan()
+        for idx, (start, count) in enumerate(plan):
+            end = start + count - 1
+            t0 = loop.time()
             try:
-                regs = await self._hub.async_read_block(self._unit, start, count)
-                for offset, addr in enumerate(range(start, end + 1)):
-                    result[addr] = regs[offset]
+                regs = await self._read_block(start, count)
+                # Gap registers are read but not published
+                result.update((addr, val) for addr, val in zip(range(start, end + 1), regs) if addr in wanted)
             except Exception as err:
                 _LOGGER.debug("Batch read failed for %s..%s: %s", start, end, err)
-            await asyncio.sleep(self._pause)
-            i = j
+                if self._max_gap:
+                    await self._read_without_gaps(start, end, result)
+            elapsed = loop.time() - t0
+            self.rtt_ewma = elapsed if self.rtt_ewma is None else 0.8 * self.rtt_ewma + 0.2 * elapsed
+            # Slow answers already provide the spacing the device needs
+            needed = self._min_gap - elapsed
+            if needed > 0 and idx < len(plan) - 1:
+                await asyncio.sleep(needed)
         return result
 
+    async def _read_without_gaps(self, start: int, end: int, result: Dict[int, int]) -> None:
+        """Re-read a failed bridged block without its gap registers.
+
+        A bridged register the device does not implement fails the whole block
+        (illegal data address); if the split read works, stop bridging.
+        """
+        addrs = [addr for addr in range(start, end + 1) if addr in self._addresses]
+        sub_blocks = _plan_blocks(addrs, self._max_count)
+        if len(sub_blocks) < 2:
+            return
+        recovered = False
+        for sub_start, sub_count in sub_blocks:
+            try:
+                regs = await self._read_block(sub_start, sub_count)
+            except Exception as err:
+                _LOGGER.debug("Batch read failed for %s..%s: %s", sub_start, sub_start + sub_count - 1, err)
+                continue
+            result.update(zip(range(sub_start, sub_start + sub_count), regs))
+            recovered = True
+        if recovered:
+            _LOGGER.info("Register gaps not readable on unit %s; disabling gap merging", self._unit)
+            self._max_gap = 0
+            self._plan = None
+
 
 class ModbusBatchManager:
     """Manage coordinators per unit and interval."""
@@ -380,18 +529,48 @@ class ModbusBatchManager:
         hass: HomeAssistant,
         hub: R290HeatPumpModbusHub,
         unit: int,
+        scan_intervals: Optional[Dict[int, int]] = None,
         *,
         block_size: int = 20,
         block_pause: float = 0.1,  # seconds
+        max_gap: int = 0,
     ):
         self._hass = hass
         self._hub = hub
         self._unit = unit
         self._coordinators: Dict[int, ModbusBatchCoordinator] = {}
+        # Per-register interval overrides; option keys arrive as strings ("0x005D")
+        self._scan_intervals: Dict[int, int] = {}
+        for addr, seconds in (scan_intervals or {}).items():
+            try:
+                key = int(addr, 0) if isinstance(addr, str) else int(addr)
+                self._scan_intervals[key] = max(1, int(seconds))
+            except (TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid scan interval %r=%r", addr, seconds)
+        self._address_interval: Dict[int, int] = {}
+        # Last published raw value per address; callbacks only fire on change
+        self._cache: Dict[int, int] = {}
+        self._callbacks: Dict[int, List[Callable[[int], None]]] = {}
         self._block_size = max(1, min(125, int(block_size)))
         self._block_pause = max(0.0, float(block_pause))
+        self._max_gap = max(0, int(max_gap))
+        # Write coalescing (disabled until enable_write_coalescing is called)
+        self._write_window = 0.0
+        self._pending_writes: Dict[int, Tuple[int, List[asyncio.Future]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Cleared once the device rejected FC16 but accepted the same registers via FC06
+        self._multi_write_ok = True
+        # Bounded read queue drained by worker_loop; caps requests waiting on the link
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self._block_size)
+        self._worker_running = False
+        # Set when the worker ended (entry unload); no reads are accepted afterwards
+        self._worker_stopped = False
+        # Caps interval refreshes started together by refresh_all
+        self._gather_sem = asyncio.Semaphore(4)
 
     def register(self, address: int, interval_seconds: int) -> None:
+        interval_seconds = self._scan_intervals.get(address, interval_seconds)
+        self._address_interval[address] = interval_seconds
         coord = self._coordinators.get(interval_seconds)
         if coord is None:
             coord = ModbusBatchCoordinator(
@@ -401,10 +580,12 @@ class ModbusBatchManager:
                 interval_seconds,
                 block_size=self._block_size,
                 block_pause=self._block_pause,
+                max_gap=self._max_gap,
+                read_block=self.async_read_block,
             )
             self._coordinators[interval_seconds] = coord
             try:
-                coord.async_add_listener(lambda: None)
+                coord.async_add_listener(lambda c=coord: self._dispatch_changes(c))
             except Exception:
                 pass
 
@@ -420,27 +601,195 @@ class ModbusBatchManager:
 
         coord.add_addresses([address])
 
+    def register_callback(self, address: int, cb: Callable[[int], None]) -> Callable[[], None]:
+        """Call cb(raw) whenever the polled value of address changes; returns an unsubscribe."""
+        self._callbacks.setdefault(address, []).append(cb)
+
+        def _remove() -> None:
+            try:
+                self._callbacks[address].remove(cb)
+            except (KeyError, ValueError):
+                pass
+
+        return _remove
+
+    def _dispatch_changes(self, coord: ModbusBatchCoordinator) -> None:
+        for address, value in coord.data.items():
+            if self._cache.get(address) == value:
+                continue
+            self._cache[address] = value
+            for cb in tuple(self._callbacks.get(address, ())):
+                try:
+                    cb(value)
+                except Exception as err:
+                    _LOGGER.debug("Value callback for register %s failed: %s", address, err)
+
     def get_cached(self, address: int, interval_seconds: int) -> Optional[int]:
-        coord = self._coordinators.get(interval_seconds)
+        coord = self._coordinators.get(self._address_interval.get(address, interval_seconds))
         if not coord:
             return None
         return coord.data.get(address)
 
+    async def async_read_block(self, start: int, count: int) -> List[int]:
+        """Read a block through the worker queue (directly if no worker runs yet)."""
+        if self._worker_stopped:
+            raise RuntimeError(f"Modbus worker stopped, dropping read {start}+{count}")
+        if not self._worker_running:
+            return await self._hub.async_read_block(self._unit, start, count)
+        fut = self._hass.loop.create_future()
+        try:
+            self._queue.put_nowait((start, count, fut))
+        except asyncio.QueueFull:
+            raise RuntimeError(f"Modbus request queue full, dropping read {start}+{count}") from None
+        return await fut
+
+    async def worker_loop(self) -> None:
+        """Drain queued block reads one at a time."""
+        self._worker_running = True
+        fut: Optional[asyncio.Future] = None
+        try:
+            while True:
+                start, count, fut = await self._queue.get()
+                try:
+                    if fut.done():
+                        continue
+                    try:
+                        regs = await self._hub.async_read_block(self._unit, start, count)
+                    except Exception as err:
+                        if not fut.done():
+                            fut.set_exception(err)
+                    else:
+                        if not fut.done():
+                            fut.set_result(regs)
+                finally:
+                    self._queue.task_done()
+        finally:
+            self._worker_running = False
+            self._worker_stopped = True
+            # Release coordinators still waiting on the interrupted and the queued reads
+            stopped = RuntimeError("Modbus worker stopped")
+            if fut is not None and not fut.done():
+                fut.set_exception(stopped)
+            while not self._queue.empty():
+                _, _, fut = self._queue.get_nowait()
+                self._queue.task_done()
+                if not fut.done():
+                    fut.set_exception(stopped)
+
+    def enable_write_coalescing(self, window_ms: float = 50.0) -> None:
+        """Buffer writes for window_ms and send contiguous runs as one FC16 request."""
+        self._write_window = max(0.0, float(window_ms)) / 1000.0
+
+    async def schedule_write(self, address: int, value: int) -> None:
+        """Write a holding register, coalesced with neighbouring writes if enabled."""
+        if self._write_window <= 0:
+            await self._hub.async_pb_write_register(self._unit, address, int(value))
+            return
+        fut = self._hass.loop.create_future()
+        # A newer value for the same address supersedes the buffered one
+        _, waiters = self._pending_writes.get(address, (None, []))
+        waiters.append(fut)
+        self._pending_writes[address] = (int(value), waiters)
+        if len(self._pending_writes) >= self._block_size:
+            self._flush_writes()
+        elif self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(self._write_window, self._flush_writes)
+        await fut
+
+    def _flush_writes(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending_writes = self._pending_writes, {}
+        if pending:
+            self._hass.async_create_task(self._async_flush_writes(pending))
+
+    async def _async_flush_writes(self, pending: Dict[int, Tuple[int, List[asyncio.Future]]]) -> None:
+        max_count = self._block_size if self._multi_write_ok else 1
+        for start, count in _plan_blocks(sorted(pending), max_count):
+            addrs = range(start, start + count)
+            if count > 1:
+                try:
+                    await self._hub.async_pb_write_registers(
+                        self._unit, start, [pending[addr][0] for addr in addrs]
+                    )
+                except Exception as exc:
+                    # z.B. Illegal Function: Register einzeln per FC06 nachschreiben
+                    _LOGGER.debug("Coalesced write failed for %s..%s, retrying singly: %s", start, start + count - 1, exc)
+                else:
+                    for addr in addrs:
+                        _resolve_waiters(pending[addr][1], None)
+                    continue
+            single_ok = True
+            for addr in addrs:
+                err: Optional[Exception] = None
+                try:
+                    await self._hub.async_pb_write_register(self._unit, addr, pending[addr][0])
+                except Exception as exc:
+                    _LOGGER.debug("Write of register %s failed: %s", addr, exc)
+                    err = exc
+                    single_ok = False
+                _resolve_waiters(pending[addr][1], err)
+            if count > 1 and single_ok and self._multi_write_ok:
+                _LOGGER.info("Unit %s rejects multi-register writes; using single writes", self._unit)
+                self._multi_write_ok = False
+
+    def schedule(self) -> Dict[int, List[Tuple[int, int]]]:
+        """Return the batched read plan per polling interval."""
+        return {interval: coord.block_plan() for interval, coord in self._coordinators.items()}
+
     def replace_hub(self, new_hub: R290HeatPumpModbusHub) -> None:
         self._hub = new_hub
         for coord in self._coordinators.values():
             coord._hub = new_hub
 
-    def update_batch_params(self, *, block_size: Optional[int] = None, block_pause: Optional[float] = None) -> None:
+    def update_batch_params(
+        self,
+        *,
+        block_size: Optional[int] = None,
+        block_pause: Optional[float] = None,
+        min_gap: Optional[float] = None,
+        max_gap: Optional[int] = None,
+    ) -> None:
+        """Apply new block size, minimum request spacing (min_gap overrides block_pause)
+        and the number of unused registers bridged per read block (max_gap)."""
+        if min_gap is not None:
+            block_pause = min_gap
         if block_size is not None:
             self._block_size = max(1, min(125, int(block_size)))
         if block_pause is not None:
             self._block_pause = max(0.0, float(block_pause))
+        if max_gap is not None:
+            self._max_gap = max(0, int(max_gap))
         for coord in self._coordinators.values():
-            if block_size is not None:
+            if block_size is not None or max_gap is not None:
                 coord._max_count = self._block_size
+                coord._max_gap = self._max_gap
+                coord._plan = None
             if block_pause is not None:
-                coord._pause = self._block_pause
+                coord._min_gap = self._block_pause
+
+    async def async_prefetch_all(self) -> None:
+        """Open the connection and refresh all registered intervals concurrently."""
+        try:
+            await self._hub.async_connect()
+        except Exception as err:
+            _LOGGER.debug("Prefetch connect failed for unit %s: %s", self._unit, err)
+            return
+        await self.refresh_all()
+
+    async def refresh_all(self) -> None:
+        """Refresh all polling intervals concurrently, at most four at a time."""
+
+        async def _refresh(coord: ModbusBatchCoordinator) -> None:
+            async with self._gather_sem:
+                await coord.async_request_refresh()
+
+        if self._coordinators:
+            await asyncio.gather(
+                *(_refresh(coord) for coord in self._coordinators.values()),
+                return_exceptions=True,
+            )
 
     async def request_refresh(self, interval_seconds: int) -> None:
         coord = self._coordinators.get(interval_seconds)
@@ -1,5 +1,8 @@
 # Version: 1.0.2
 # Last modified: 2026-05-01 10:48 by CNC-Buddy
+import asyncio
+from functools import partial
+from types import MappingProxyType
 from typing import Optional
 import logging
 from homeassistant.components.number import NumberEntity, NumberDeviceClass, NumberMode
@@ -19,6 +22,118 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
+def _prepare_params(params) -> tuple:
+    """Slug and hex address per parameter, computed once at import."""
+    prepared = []
+    for param_info in params:
+        addr = param_info.get("address")
+        try:
+            addr_hex = f"{int(addr):04X}"
+        except Exception:
+            addr_hex = str(addr)
+        # e.g. p259_mixing_valve_full_cycle_time
+        prepared.append((MappingProxyType(param_info), slugify(param_info["name"]), addr_hex))
+    return tuple(prepared)
+
+
+def _resolve_float(entry: ConfigEntry, keys: tuple[str, ...], default: float) -> float:
+    """First set value of keys in entry.options, then entry.data, as float."""
+    for source in (entry.options, entry.data):
+        for key in keys:
+            val = source.get(key)
+            if val is None:
+                continue
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                return float(default)
+    return float(default)
+
+# (key, min, max, step, default) of the heat-curve parameter numbers
+_HEATCURVE_DEFS = (
+    ("t_out_min", -30, 10, 1, -15.0),
+    ("t_out_max", 0, 35, 1, 20.0),
+    ("t_flow_min", 20, 60, 1, 25.0),
+    ("t_flow_max", 25, 70, 1, 50.0),
+    ("inertia_hours", 0.0, 24.0, 0.1, 0.0),
+    ("stepsize_c", 0.0, 2.0, 0.1, 0.5),
+)
+
+# Slider-Eingaben sammeln, bevor der Config-Entry geschrieben wird
+_ENTRY_WRITE_DELAY = 0.25
+_pending_entry_writes: dict[str, asyncio.TimerHandle] = {}
+# entry_id -> {option key: number entity holding the new value}
+_pending_entry_values: dict[str, dict[str, NumberEntity]] = {}
+
+
+def _queue_entry_write(hass: HomeAssistant, entry: ConfigEntry, entity: NumberEntity) -> None:
+    """Schedule persisting entity's value; a newer change restarts the window."""
+    handle = _pending_entry_writes.pop(entry.entry_id, None)
+    if handle is not None:
+        handle.cancel()
+    _pending_entry_values.setdefault(entry.entry_id, {})[entity._key] = entity
+    _pending_entry_writes[entry.entry_id] = hass.loop.call_later(
+        _ENTRY_WRITE_DELAY, _flush_entry_writes, hass, entry
+    )
+
+
+def _flush_entry_writes(hass: HomeAssistant, entry: ConfigEntry, publish: bool = True) -> None:
+    """Write the queued values into the entry, then publish the entity states."""
+    handle = _pending_entry_writes.pop(entry.entry_id, None)
+    if handle is not None:
+        handle.cancel()
+    pending = _pending_entry_values.pop(entry.entry_id, None)
+    if not pending:
+        return
+    values = {key: entity._attr_native_value for key, entity in pending.items()}
+    drop = {legacy for entity in pending.values() for legacy in entity._legacy_keys}
+    opts = {k: v for k, v in entry.options.items() if k not in drop}
+    opts.update(values)
+    data_store = {k: v for k, v in entry.data.items() if k not in drop}
+    data_store.update(values)
+    hass.config_entries.async_update_entry(entry, options=opts, data=data_store)
+    if publish:
+        # States go out after the entry so listeners read the new options
+        for entity in pending.values():
+            entity.async_write_ha_state()
+
+
+_UID_FMT = "r290_heatpump_%s_%s_slave_%s_v2"
+_EID_FMT = "number.r290_heatpump_%s_slave_%s"
+
+_UNIT_SYSTEM_PREPARED = _prepare_params(UNIT_SYSTEM_WRITABLE_PARAMETERS)
+_USER_PARAMS_PREPARED = _prepare_params(USER_PARAMETERS_WRITABLE_NUMBERS)
+
+# device_type -> (device identifier, device name)
+_CURVE_DEVICES = MappingProxyType({
+    "heating_curve": ("r290_heatpump_heating_curve", "R290 Heat Pump Heating Curve"),
+    "floor_heating_curve": ("r290_heatpump_floor_heating_curve", "R290 Heat Pump Floor Heating Curve"),
+    "hot_water_curve": ("r290_heatpump_hotwater_curve", "R290 Heat Pump Hot Water Curve"),
+    "cooling_curve": ("r290_heatpump_cooling_curve", "R290 Heat Pump Cooling Curve"),
+})
+_DEVICE_TYPE_TO_PREFIX = MappingProxyType({
+    "heating_curve": "heating",
+    "floor_heating_curve": "floor_heating",
+    "hot_water_curve": "hotwater",
+    "cooling_curve": "cooling",
+})
+_CURVE_FRIENDLY_NAMES = MappingProxyType({
+    "heating": "Heating Curve",
+    "floor_heating": "Floor Heating Curve",
+    "hotwater": "Hot Water Curve",
+    "cooling": "Cooling Curve",
+})
+# Map keys to friendly names and entity_id suffixes
+_HC_NAME_MAP = MappingProxyType({
+    "t_out_min": ("Min Outdoor temperature for maximum flow temperature", "t_out_min"),
+    "t_out_max": ("Max Outdoor temperature for minimum flow temperature", "t_out_max"),
+    "t_flow_min": ("Minimum flow temperature", "t_flow_min"),
+    "t_flow_max": ("Maximum flow temperature", "t_flow_max"),
+    "inertia_hours": ("Inertia (hours)", "inertia_hours"),
+    "stepsize_c": ("Step Size (degC)", "stepsize_c"),
+})
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -32,11 +147,11 @@ async def async_setup_entry(
         slave_id = entry.data[CONF_SLAVE]
         long_interval = entry.options.get("long_scan_interval", entry.data.get("long_scan_interval", 600))
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
             _LOGGER.error("Internal Modbus hub not initialised")
             return
-        hub = store["hub"]
-        batch = store.get("batch")
+        hub = store.hub
+        batch = store.batch
 
         unit_system_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"r290_heatpump_{slave_id}_unit_system_parameters")},
@@ -54,45 +169,27 @@ async def async_setup_entry(
             sw_version="1.0.0",
         )
 
-        for param_info in UNIT_SYSTEM_WRITABLE_PARAMETERS:
-            param_data = param_info.copy()
-            name_slug = slugify(param_info["name"])  # e.g. p259_mixing_valve_full_cycle_time
-            addr = param_info.get("address")
-            try:
-                addr_hex = f"{int(addr):04X}"
-            except Exception:
-                addr_hex = str(addr)
-            param_data["unique_id"] = f"r290_heatpump_{name_slug}_{addr_hex}_slave_{slave_id}_v2"
+        for base, name_slug, addr_hex in _UNIT_SYSTEM_PREPARED:
+            uid = _UID_FMT % (name_slug, addr_hex, slave_id)
             number_entity = R290HeatPumpModbusNumber(
-                hass, entry, param_data, slave_id, long_interval, hub, unit_system_device_info, batch
+                hass, entry, base, uid, slave_id, long_interval, hub, unit_system_device_info, batch,
+                name_slug=name_slug,
             )
             entities.append(number_entity)
 
         # Add user-parameter writable numbers (e.g., temperature setpoints) only for slave 1
         if int(slave_id) == 1:
-            for param_info in USER_PARAMETERS_WRITABLE_NUMBERS:
-                param_data = param_info.copy()
-                name_slug = slugify(param_info["name"])  # e.g. indoor_temperature_set_point
-                addr = param_info.get("address")
-                try:
-                    addr_hex = f"{int(addr):04X}"
-                except Exception:
-                    addr_hex = str(addr)
-                param_data["unique_id"] = f"r290_heatpump_{name_slug}_{addr_hex}_slave_{slave_id}_v2"
+            for base, name_slug, addr_hex in _USER_PARAMS_PREPARED:
+                uid = _UID_FMT % (name_slug, addr_hex, slave_id)
                 number_entity = R290HeatPumpModbusNumber(
-                    hass, entry, param_data, slave_id, long_interval, hub, user_params_device_info, batch
+                    hass, entry, base, uid, slave_id, long_interval, hub, user_params_device_info, batch,
+                    name_slug=name_slug,
                 )
                 entities.append(number_entity)
 
     elif device_type in ("heating_curve", "floor_heating_curve", "hot_water_curve", "cooling_curve"):
         # Expose parameter numbers that persist into entry.options
-        name_map = {
-            "heating_curve": ("r290_heatpump_heating_curve", "R290 Heat Pump Heating Curve"),
-            "floor_heating_curve": ("r290_heatpump_floor_heating_curve", "R290 Heat Pump Floor Heating Curve"),
-            "hot_water_curve": ("r290_heatpump_hotwater_curve", "R290 Heat Pump Hot Water Curve"),
-            "cooling_curve": ("r290_heatpump_cooling_curve", "R290 Heat Pump Cooling Curve"),
-        }
-        dev_id, dev_name = name_map.get(device_type, ("r290_heatpump_heating_curve", "R290 Heat Pump Heating Curve"))
+        dev_id, dev_name = _CURVE_DEVICES.get(device_type, ("r290_heatpump_heating_curve", "R290 Heat Pump Heating Curve"))
         device_info = DeviceInfo(
             identifiers={(DOMAIN, dev_id)},
             name=dev_name,
@@ -101,32 +198,11 @@ async def async_setup_entry(
             sw_version="1.0.0",
         )
         curve_cfg = PV_CURVE_CONFIG.get(device_type, {})
-        curve_prefix = {
-            "heating_curve": "heating",
-            "floor_heating_curve": "floor_heating",
-            "hot_water_curve": "hotwater",
-            "cooling_curve": "cooling",
-        }.get(device_type, "heating")
-
-        defs = {
-            "t_out_min": (-30, 10, 1, -15.0),
-            "t_out_max": (0, 35, 1, 20.0),
-            "t_flow_min": (20, 60, 1, 25.0),
-            "t_flow_max": (25, 70, 1, 50.0),
-            "inertia_hours": (0.0, 24.0, 0.1, 0.0),
-            "stepsize_c": (0.0, 2.0, 0.1, 0.5),
-        }
-        for key, (vmin, vmax, step, default) in defs.items():
-            if key == "stepsize_c":
-                init = entry.options.get("stepsize_c")
-                if init is None:
-                    init = entry.options.get("deadband_c")
-                if init is None:
-                    init = entry.data.get("stepsize_c", entry.data.get("deadband_c", default))
-            else:
-                init = entry.options.get(key, entry.data.get(key, default))
-            if init is None:
-                init = default
+        curve_prefix = _DEVICE_TYPE_TO_PREFIX.get(device_type, "heating")
+
+        for key, vmin, vmax, step, default in _HEATCURVE_DEFS:
+            keys = (key, "deadband_c") if key == "stepsize_c" else (key,)
+            init = _resolve_float(entry, keys, default)
             entities.append(
                 HeatCurveParamNumber(
                     hass,
@@ -145,12 +221,7 @@ async def async_setup_entry(
         if slave_id == 1 and device_type in PV_CURVE_CONFIG:
             curve_cfg = PV_CURVE_CONFIG[device_type]
             prefix = curve_cfg.get("prefix", "heating")
-            friendly_curve = {
-                "heating": "Heating Curve",
-                "floor_heating": "Floor Heating Curve",
-                "hotwater": "Hot Water Curve",
-                "cooling": "Cooling Curve",
-            }.get(prefix, "Heating Curve")
+            friendly_curve = _CURVE_FRIENDLY_NAMES.get(prefix, "Heating Curve")
             pv_device_info = DeviceInfo(
                 identifiers={(DOMAIN, f"r290_heatpump_{slave_id}_{prefix}_pv_optimization")},
                 name=f"R290 Heat Pump PV Optimization ({friendly_curve})",
@@ -158,84 +229,26 @@ async def async_setup_entry(
                 model="PV Optimization",
                 sw_version="1.0.0",
             )
-            grid_threshold_legacy = entry.options.get(
-                "pv_grid_threshold_kw", entry.data.get("pv_grid_threshold_kw")
-            )
-            grid_min_default = entry.options.get(
-                "pv_grid_threshold_min_kw",
-                entry.data.get(
-                    "pv_grid_threshold_min_kw",
-                    grid_threshold_legacy
-                    if grid_threshold_legacy is not None
-                    else curve_cfg.get(
-                        "grid_threshold_min_default",
-                        curve_cfg.get("grid_threshold_default", 2.0),
-                    ),
-                ),
+            grid_min_default = _resolve_float(
+                entry,
+                ("pv_grid_threshold_min_kw", "pv_grid_threshold_kw"),
+                curve_cfg.get("grid_threshold_min_default", curve_cfg.get("grid_threshold_default", 2.0)),
             )
-            grid_max_default = entry.options.get(
-                "pv_grid_threshold_max_kw",
-                entry.data.get(
-                    "pv_grid_threshold_max_kw",
-                    grid_threshold_legacy
-                    if grid_threshold_legacy is not None
-                    else curve_cfg.get(
-                        "grid_threshold_max_default",
-                        curve_cfg.get("grid_threshold_default", float(grid_min_default)),
-                    ),
-                ),
+            grid_max_default = _resolve_float(
+                entry,
+                ("pv_grid_threshold_max_kw", "pv_grid_threshold_kw"),
+                curve_cfg.get("grid_threshold_max_default", curve_cfg.get("grid_threshold_default", grid_min_default)),
             )
-            try:
-                grid_min_default = float(grid_min_default)
-            except (TypeError, ValueError):
-                grid_min_default = float(
-                    curve_cfg.get(
-                        "grid_threshold_min_default",
-                        curve_cfg.get("grid_threshold_default", 2.0),
-                    )
-                )
-            try:
-                grid_max_default = float(grid_max_default)
-            except (TypeError, ValueError):
-                grid_max_default = float(
-                    curve_cfg.get(
-                        "grid_threshold_max_default",
-                        curve_cfg.get("grid_threshold_default", grid_min_default),
-                    )
-                )
             if grid_max_default < grid_min_default:
                 grid_max_default = grid_min_default
-            offset_reset_default = entry.options.get(
-                "pv_offset_reset_kw",
-                entry.data.get(
-                    "pv_offset_reset_kw",
-                    curve_cfg.get("offset_reset_default", 0.25),
-                ),
+            offset_reset_default = _resolve_float(
+                entry, ("pv_offset_reset_kw",), curve_cfg.get("offset_reset_default", 0.25)
             )
-            try:
-                offset_reset_default = float(offset_reset_default)
-            except (TypeError, ValueError):
-                offset_reset_default = float(curve_cfg.get("offset_reset_default", 0.25))
-            battery_default = entry.options.get(
-                "pv_battery_threshold_pct",
-                entry.data.get(
-                    "pv_battery_threshold_pct",
-                    curve_cfg.get("battery_threshold_default", 80.0),
-                ),
+            battery_default = _resolve_float(
+                entry, ("pv_battery_threshold_pct",), curve_cfg.get("battery_threshold_default", 80.0)
             )
-            try:
-                battery_default = float(battery_default)
-            except (TypeError, ValueError):
-                battery_default = float(curve_cfg.get("battery_threshold_default", 80.0))
-            hold_default = entry.options.get(
-                "pv_hold_minutes",
-                entry.options.get(
-                    "pv_cooldown_minutes",
-                    entry.data.get(
-                        "pv_hold_minutes",
-                        entry.data.get("pv_cooldown_minutes", curve_cfg.get("hold_default", 15)),
-                    ),
-                ),
+            hold_default = _resolve_float(
+                entry, ("pv_hold_minutes", "pv_cooldown_minutes"), curve_cfg.get("hold_default", 15)
             )
             entities.append(
                 HeatcurvePvNumber(
@@ -315,11 +328,7 @@ async def async_setup_entry(
                     legacy_keys=("pv_cooldown_minutes",),
                 )
             )
-        external_default = entry.options.get("external_offset_value", entry.data.get("external_offset_value", 0.0))
-        try:
-            external_default = float(external_default)
-        except (TypeError, ValueError):
-            external_default = 0.0
+        external_default = _resolve_float(entry, ("external_offset_value",), 0.0)
         entities.append(
             HeatcurveExternalOffsetNumber(
                 hass=hass,
@@ -329,19 +338,11 @@ async def async_setup_entry(
                 initial_value=external_default,
             )
         )
-        external_hold_default = entry.options.get(
-            "external_offset_hold_minutes",
-            entry.data.get(
-                "external_offset_hold_minutes",
-                curve_cfg.get("external_hold_default", 5.0) if device_type in PV_CURVE_CONFIG else 5.0,
-            ),
+        external_hold_default = _resolve_float(
+            entry,
+            ("external_offset_hold_minutes",),
+            curve_cfg.get("external_hold_default", 5.0) if device_type in PV_CURVE_CONFIG else 5.0,
         )
-        try:
-            external_hold_default = float(external_hold_default)
-        except (TypeError, ValueError):
-            external_hold_default = float(
-                curve_cfg.get("external_hold_default", 5.0) if device_type in PV_CURVE_CONFIG else 5.0
-            )
         entities.append(
             HeatcurveExternalOffsetHoldNumber(
                 hass=hass,
@@ -352,8 +353,35 @@ async def async_setup_entry(
             )
         )
 
+    modbus_entities = [e for e in entities if isinstance(e, R290HeatPumpModbusNumber)]
+    option_entities = [e for e in entities if not isinstance(e, R290HeatPumpModbusNumber)]
+    if option_entities:
+        # Persist all resolved defaults with one entry update instead of one per entity
+        new_opts = dict(entry.options)
+        new_data = dict(entry.data)
+        for entity in option_entities:
+            entity._stage_entry_values(new_opts, new_data)
+        if new_opts != entry.options or new_data != entry.data:
+            hass.config_entries.async_update_entry(entry, options=new_opts, data=new_data)
+        # Do not lose a value still waiting in the write window
+        entry.async_on_unload(partial(_flush_entry_writes, hass, entry, publish=False))
+
     _LOGGER.info("Registering %s number entities for %s", len(entities), device_type)
-    async_add_entities(entities, update_before_add=True)
+    if option_entities:
+        # Values are resolved from the entry above, nothing to update before adding
+        async_add_entities(option_entities, update_before_add=False)
+    if modbus_entities:
+        for entity in modbus_entities:
+            entity._ensure_registered()
+            entity._apply_cached()
+        async_add_entities(modbus_entities, update_before_add=False)
+        batch = modbus_entities[0]._batch
+        if batch is not None:
+            # Ein gemeinsamer Poll im Hintergrund, die Werte kommen über die Callbacks;
+            # an offline bridge must not hold up platform setup
+            entry.async_create_background_task(
+                hass, batch.refresh_all(), "r290_heatpump_number_refresh"
+            )
 
     for entity in entities:
         hass.data.setdefault(DOMAIN, {})[entity.entity_id] = entity
@@ -362,67 +390,77 @@ async def async_setup_entry(
 class R290HeatPumpModbusNumber(NumberEntity):
     """Representation of an R290 Heat Pump number (writable parameter)."""
 
-    def __init__(self, hass, entry, param_info, slave_id, scan_interval, hub, device_info, batch_manager):
+    __slots__ = ("_hass", "_entry", "_p", "_slave_id", "_hub", "_batch", "_scan_interval", "_is_int16", "_registered")
+
+    def __init__(
+        self, hass, entry, param_info, unique_id, slave_id, scan_interval, hub, device_info, batch_manager,
+        *, name_slug=None,
+    ):
         super().__init__()
         self._hass = hass
         self._entry = entry
-        self._address = param_info["address"]
-        self._scale = param_info["scale"]
-        self._unit = param_info["unit"]
-        self._name = param_info["name"]
-        self._unique_id = param_info["unique_id"]
-        self._device_class = param_info["device_class"]
-        self._min_value = param_info["min_value"]
-        self._max_value = param_info["max_value"]
-        self._step = param_info["step"]
-        self._mode = param_info["mode"]
-        self._precision = param_info["precision"]
-        self._data_type = param_info.get("data_type", "int16")
-        self._input_type = param_info.get("input_type", "holding")
+        # Shared, read-only parameter descriptor (address, scale, precision, data_type, ...)
+        self._p = param_info
         self._slave_id = slave_id
         self._hub = hub
         self._batch = batch_manager
-        self._scan_interval = scan_interval
-        self._value = None
+        self._scan_interval = int(scan_interval)
+        self._is_int16 = str(param_info.get("data_type", "int16")).lower() == "int16"
         self._registered = False
 
-        self._attr_name = self._name
-        self._attr_native_value = self._value
-        self._attr_native_unit_of_measurement = self._unit
-        self._attr_device_class = self._device_class
-        self._attr_unique_id = self._unique_id
+        self._attr_name = param_info["name"]
+        self._attr_native_value = None
+        self._attr_native_unit_of_measurement = param_info["unit"]
+        self._attr_device_class = param_info["device_class"]
+        self._attr_unique_id = unique_id
         self._attr_device_info = device_info
-        self._attr_should_poll = True
-        self._attr_native_min_value = self._min_value
-        self._attr_native_max_value = self._max_value
-        self._attr_native_step = self._step
-        self._attr_mode = self._mode
+        # Values are pushed by the batch manager (register_callback)
+        self._attr_should_poll = False
+        self._attr_native_min_value = param_info["min_value"]
+        self._attr_native_max_value = param_info["max_value"]
+        self._attr_native_step = param_info["step"]
+        self._attr_mode = param_info["mode"]
 
-        try:
-            base = slugify(self._name)
-            self.entity_id = f"number.r290_heatpump_{base}_slave_{self._slave_id}"
-        except Exception:
-            pass
+        # Slug comes precomputed from _prepare_params
+        self.entity_id = _EID_FMT % (name_slug or slugify(self._attr_name), self._slave_id)
 
-        _LOGGER.debug("Number %s initialisiert mit unique_id=%s", self._name, self._attr_unique_id)
+        _LOGGER.debug("Number %s initialisiert mit unique_id=%s", self._attr_name, self._attr_unique_id)
+
+    def _ensure_registered(self) -> None:
+        if self._batch and not self._registered:
+            try:
+                self._batch.register(self._p["address"], self._scan_interval)
+                self._registered = True
+            except Exception as e:
+                _LOGGER.debug("Initial number register failed for %s: %s", self._attr_name, e)
+
+    def _decode(self, value) -> None:
+        """Convert a raw register value into the number state."""
+        raw = int(value)
+        if self._is_int16 and raw >= 0x8000:
+            raw -= 0x10000
+        self._attr_native_value = round(raw * self._p["scale"], self._p["precision"])
+
+    def _apply_cached(self) -> None:
+        value = None
+        if self._batch:
+            value = self._batch.get_cached(self._p["address"], self._scan_interval)
+        if value is not None:
+            self._decode(value)
+
+    def _on_value(self, value) -> None:
+        """Push update from the batch manager; only fired when the raw value changed."""
+        self._decode(value)
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
-        _LOGGER.info("Number %s added to Home Assistant", self._name)
-        try:
-            if self._batch:
-                interval = int(self._scan_interval)
-                try:
-                    self._batch.register(self._address, interval)
-                    self._registered = True
-                except Exception:
-                    pass
-                if hasattr(self._batch, "request_refresh"):
-                    try:
-                        await self._batch.request_refresh(interval)
-                    except Exception:
-                        pass
-        except Exception as e:
-            _LOGGER.debug("Initial number register failed for %s: %s", self._name, e)
+        _LOGGER.info("Number %s added to Home Assistant", self._attr_name)
+        # Registration and the initial poll happen in async_setup_entry
+        self._ensure_registered()
+        if self._batch:
+            self.async_on_remove(self._batch.register_callback(self._p["address"], self._on_value))
+            # A poll may have finished between setup and subscribing
+            self._apply_cached()
 
     async def async_set_native_value(self, value):
         try:
@@ -431,40 +469,24 @@ class R290HeatPumpModbusNumber(NumberEntity):
                 raw = float(value)
             except Exception:
                 pass
-            write_value = int(round(raw / self._scale))
-            if str(self._data_type).lower() == "int16" and write_value < 0:
+            write_value = int(round(raw / self._p["scale"]))
+            if self._is_int16 and write_value < 0:
                 write_value &= 0xFFFF
-            await self._hub.async_pb_write_register(self._slave_id, self._address, write_value)
+            if self._batch:
+                await self._batch.schedule_write(self._p["address"], write_value)
+            else:
+                await self._hub.async_pb_write_register(self._slave_id, self._p["address"], write_value)
             self._attr_native_value = float(raw)
-            _LOGGER.debug("Wert %s (raw=%s) in Register %s geschrieben", value, write_value, self._address)
+            # Not polled: publish the written value ourselves
+            self.async_write_ha_state()
+            _LOGGER.debug("Wert %s (raw=%s) in Register %s geschrieben", value, write_value, self._p["address"])
             try:
                 if self._batch and hasattr(self._batch, "request_refresh"):
-                    await self._batch.request_refresh(int(self._scan_interval))
+                    await self._batch.request_refresh(self._scan_interval)
             except Exception:
                 pass
         except Exception as e:
-            _LOGGER.error("Fehler beim Schreiben von Modbus-Daten an %s (addr=%s, raw=%s): %s", self._name, self._address, value, e)
-
-    async def async_update(self):
-        try:
-            if self._batch and not self._registered:
-                try:
-                    interval = int(self._scan_interval)
-                    self._batch.register(self._address, interval)
-                    self._registered = True
-                except Exception as e:
-                    _LOGGER.debug("Initial number register failed for %s: %s", self._name, e)
-            value = None
-            if self._batch:
-                value = self._batch.get_cached(self._address, int(self._scan_interval))
-            if value is not None:
-                raw = int(value)
-                if str(self._data_type).lower() == "int16":
-                    if raw >= 0x8000:
-                        raw -= 0x10000
-                self._attr_native_value = round(raw * self._scale, self._precision)
-        except Exception as e:
-            _LOGGER.debug("Number update failed for %s: %s", self._name, e)
+            _LOGGER.error("Fehler beim Schreiben von Modbus-Daten an %s (addr=%s, raw=%s): %s", self._attr_name, self._p["address"], value, e)
 
 
 class HeatCurveParamNumber(NumberEntity):
@@ -486,16 +508,7 @@ class HeatCurveParamNumber(NumberEntity):
         self._key = key
         self._default_value = float(default_value)
         self._legacy_keys: tuple[str, ...] = ()
-        # Map keys to friendly names and entity_id suffixes
-        name_map = {
-            "t_out_min": ("Min Outdoor temperature for maximum flow temperature", "t_out_min"),
-            "t_out_max": ("Max Outdoor temperature for minimum flow temperature", "t_out_max"),
-            "t_flow_min": ("Minimum flow temperature", "t_flow_min"),
-            "t_flow_max": ("Maximum flow temperature", "t_flow_max"),
-            "inertia_hours": ("Inertia (hours)", "inertia_hours"),
-            "stepsize_c": ("Step Size (degC)", "stepsize_c"),
-        }
-        friendly, base_suffix = name_map.get(key, (key, key))
+        friendly, base_suffix = _HC_NAME_MAP.get(key, (key, key))
         if key == "stepsize_c":
             self._legacy_keys = ("deadband_c",)
         self._attr_name = friendly
@@ -520,69 +533,34 @@ class HeatCurveParamNumber(NumberEntity):
         self._attr_mode = NumberMode.BOX
         # Stable entity_id names (domain number)
         try:
-            curve_prefix = {
-                "heating_curve": "heating",
-                "floor_heating_curve": "floor_heating",
-                "hot_water_curve": "hotwater",
-                "cooling_curve": "cooling",
-            }.get(entry.data.get("device_type"), "heating")
+            curve_prefix = _DEVICE_TYPE_TO_PREFIX.get(entry.data.get("device_type"), "heating")
             suffix = f"{curve_prefix}_{base_suffix}"
             self.entity_id = f"number.r290_heatpump_{suffix}"
         except Exception:
             pass
 
     def _resolve_value(self) -> float:
-        try:
-            limit_sources = (self._entry.options, self._entry.data)
-        except AttributeError:
-            limit_sources = (self._entry.options,)
-        for source in limit_sources:
-            for candidate in (self._key, *self._legacy_keys):
-                if candidate in source:
-                    val = source.get(candidate)
-                    if val is None:
-                        continue
-                    try:
-                        return float(val)
-                    except (TypeError, ValueError):
-                        return self._default_value
-        return self._default_value
+        return _resolve_float(self._entry, (self._key, *self._legacy_keys), self._default_value)
 
     async def async_set_native_value(self, value: float) -> None:
         numeric = float(value)
+        if self._attr_native_value == numeric:
+            return
         self._attr_native_value = numeric
-        opts = dict(self._entry.options)
-        opts[self._key] = numeric
-        for legacy in self._legacy_keys:
-            opts.pop(legacy, None)
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
-        data_store = dict(self._entry.data)
-        data_store[self._key] = numeric
-        for legacy in self._legacy_keys:
-            data_store.pop(legacy, None)
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
+        # Entry write and state update follow once the value settles
+        _queue_entry_write(self.hass, self._entry, self)
 
-    async def async_added_to_hass(self) -> None:
+    def _stage_entry_values(self, opts: dict, data: dict) -> None:
+        """Write the resolved value into the pending entry options/data."""
         resolved = self._resolve_value()
         self._attr_native_value = resolved
-        opts = dict(self._entry.options)
-        opts[self._key] = resolved
-        for legacy in self._legacy_keys:
-            opts.pop(legacy, None)
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
-        data_store = dict(self._entry.data)
-        data_store[self._key] = resolved
-        for legacy in self._legacy_keys:
-            data_store.pop(legacy, None)
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
+        for store in (opts, data):
+            store[self._key] = resolved
+            for legacy in self._legacy_keys:
+                store.pop(legacy, None)
 
-    async def async_update(self) -> None:
-        try:
-            self._attr_native_value = float(self._resolve_value())
-        except (TypeError, ValueError):
-            self._attr_native_value = self._default_value
+    async def async_added_to_hass(self) -> None:
+        self.async_write_ha_state()
 
 class HeatcurvePvNumber(NumberEntity):
     def __init__(
@@ -605,13 +583,7 @@ class HeatcurvePvNumber(NumberEntity):
         self._entry = entry
         self._key = key
         self._legacy_keys: tuple[str, ...] = tuple(legacy_keys or ())
-        curve_names = {
-            "heating": "Heating Curve",
-            "floor_heating": "Floor Heating Curve",
-            "hotwater": "Hot Water Curve",
-            "cooling": "Cooling Curve",
-        }
-        friendly_curve = curve_names.get(prefix, "Heating Curve")
+        friendly_curve = _CURVE_FRIENDLY_NAMES.get(prefix, "Heating Curve")
         self._attr_name = f"{friendly_curve} {name}"
         self._attr_unique_id = f"r290_heatpump_{prefix}_{key}_{entry.entry_id}"
         self._attr_device_info = device_info
@@ -632,62 +604,27 @@ class HeatcurvePvNumber(NumberEntity):
             pass
 
     def _resolve_value(self) -> float:
-        sources = []
-        if hasattr(self._entry, "options"):
-            sources.append(self._entry.options)
-        if hasattr(self._entry, "data"):
-            sources.append(self._entry.data)
-        for source in sources:
-            if not source:
-                continue
-            for key in (self._key, *self._legacy_keys):
-                if key in source:
-                    val = source.get(key)
-                    if val is None:
-                        continue
-                    try:
-                        return float(val)
-                    except (TypeError, ValueError):
-                        return self._default_value
-        return self._default_value
+        return _resolve_float(self._entry, (self._key, *self._legacy_keys), self._default_value)
 
-    async def async_added_to_hass(self) -> None:
+    def _stage_entry_values(self, opts: dict, data: dict) -> None:
+        """Write the resolved value into the pending entry options/data."""
         resolved = self._resolve_value()
         self._attr_native_value = resolved
-        opts = dict(self._entry.options)
-        opts[self._key] = resolved
-        for legacy in self._legacy_keys:
-            opts.pop(legacy, None)
-        self.hass.config_entries.async_update_entry(self._entry, options=opts)
-
-        data_store = dict(self._entry.data)
-        data_store[self._key] = resolved
-        for legacy in self._legacy_keys:
-            data_store.pop(legacy, None)
-        self.hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
+        for store in (opts, data):
+            store[self._key] = resolved
+            for legacy in self._legacy_keys:
+                store.pop(legacy, None)
 
+    async def async_added_to_hass(self) -> None:
+        self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         numeric = float(value)
+        if self._attr_native_value == numeric:
+            return
         self._attr_native_value = numeric
-        opts = dict(self._entry.options)
-        opts[self._key] = numeric
-        for legacy in self._legacy_keys:
-            opts.pop(legacy, None)
-        self.hass.config_entries.async_update_entry(self._entry, options=opts)
-        data_store = dict(self._entry.data)
-        data_store[self._key] = numeric
-        for legacy in self._legacy_keys:
-            data_store.pop(legacy, None)
-        self.hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        try:
-            self._attr_native_value = float(self._resolve_value())
-        except (TypeError, ValueError):
-            self._attr_native_value = self._default_value
+        # Entry write and state update follow once the value settles
+        _queue_entry_write(self.hass, self._entry, self)
 
 
 
@@ -706,13 +643,8 @@ class HeatcurveExternalOffsetNumber(NumberEntity):
         self._entry = entry
         self._prefix = prefix
         self._key = "external_offset_value"
-        curve_names = {
-            "heating": "Heating Curve",
-            "floor_heating": "Floor Heating Curve",
-            "hotwater": "Hot Water Curve",
-            "cooling": "Cooling Curve",
-        }
-        friendly_curve = curve_names.get(prefix, "Heating Curve")
+        self._legacy_keys: tuple[str, ...] = ()
+        friendly_curve = _CURVE_FRIENDLY_NAMES.get(prefix, "Heating Curve")
         self._attr_name = f"{friendly_curve} External Offset"
         self._attr_unique_id = f"r290_heatpump_{prefix}_external_offset_{entry.entry_id}"
         self._attr_device_info = device_info
@@ -730,40 +662,25 @@ class HeatcurveExternalOffsetNumber(NumberEntity):
         except Exception:
             pass
 
-    async def async_added_to_hass(self) -> None:
-        opts = dict(self._entry.options)
+    def _stage_entry_values(self, opts: dict, data: dict) -> None:
+        """Write the resolved value into the pending entry options/data."""
         if self._key in opts:
             try:
                 self._attr_native_value = float(opts[self._key])
             except (TypeError, ValueError):
                 self._attr_native_value = 0.0
-                opts[self._key] = self._attr_native_value
-        else:
-            opts[self._key] = self._attr_native_value
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
+        opts[self._key] = data[self._key] = self._attr_native_value
 
-        data_store = dict(self._entry.data)
-        data_store[self._key] = self._attr_native_value
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
+    async def async_added_to_hass(self) -> None:
         self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
-        self._attr_native_value = float(value)
-        opts = dict(self._entry.options)
-        opts[self._key] = float(value)
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
-        data_store = dict(self._entry.data)
-        data_store[self._key] = float(value)
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        try:
-            self._attr_native_value = float(
-                self._entry.options.get(self._key, self._entry.data.get(self._key, self._attr_native_value))
-            )
-        except (TypeError, ValueError):
-            self._attr_native_value = 0.0
+        numeric = float(value)
+        if self._attr_native_value == numeric:
+            return
+        self._attr_native_value = numeric
+        # Entry write and state update follow once the value settles
+        _queue_entry_write(self.hass, self._entry, self)
 
 
 class HeatcurveExternalOffsetHoldNumber(NumberEntity):
@@ -781,13 +698,8 @@ class HeatcurveExternalOffsetHoldNumber(NumberEntity):
         self._entry = entry
         self._prefix = prefix
         self._key = "external_offset_hold_minutes"
-        curve_names = {
-            "heating": "Heating Curve",
-            "floor_heating": "Floor Heating Curve",
-            "hotwater": "Hot Water Curve",
-            "cooling": "Cooling Curve",
-        }
-        friendly_curve = curve_names.get(prefix, "Heating Curve")
+        self._legacy_keys: tuple[str, ...] = ()
+        friendly_curve = _CURVE_FRIENDLY_NAMES.get(prefix, "Heating Curve")
         self._attr_name = f"{friendly_curve} External Offset Hold"
         self._attr_unique_id = f"r290_heatpump_{prefix}_external_offset_hold_{entry.entry_id}"
         self._attr_device_info = device_info
@@ -805,37 +717,22 @@ class HeatcurveExternalOffsetHoldNumber(NumberEntity):
         except Exception:
             pass
 
-    async def async_added_to_hass(self) -> None:
-        opts = dict(self._entry.options)
+    def _stage_entry_values(self, opts: dict, data: dict) -> None:
+        """Write the resolved value into the pending entry options/data."""
         if self._key in opts:
             try:
                 self._attr_native_value = float(opts[self._key])
             except (TypeError, ValueError):
                 self._attr_native_value = 0.0
-                opts[self._key] = self._attr_native_value
-        else:
-            opts[self._key] = self._attr_native_value
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
+        opts[self._key] = data[self._key] = self._attr_native_value
 
-        data_store = dict(self._entry.data)
-        data_store[self._key] = self._attr_native_value
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
+    async def async_added_to_hass(self) -> None:
         self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
-        self._attr_native_value = float(value)
-        opts = dict(self._entry.options)
-        opts[self._key] = float(value)
-        self._hass.config_entries.async_update_entry(self._entry, options=opts)
-        data_store = dict(self._entry.data)
-        data_store[self._key] = float(value)
-        self._hass.config_entries.async_update_entry(self._entry, data=data_store)
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        try:
-            self._attr_native_value = float(
-                self._entry.options.get(self._key, self._entry.data.get(self._key, self._attr_native_value))
-            )
-        except (TypeError, ValueError):
-            self._attr_native_value = 0.0
+        numeric = float(value)
+        if self._attr_native_value == numeric:
+            return
+        self._attr_native_value = numeric
+        # Entry write and state update follow once the value settles
+        _queue_entry_write(self.hass, self._entry, self)
@@ -29,11 +29,11 @@ async def async_setup_entry(
     if device_type == "heat_pump":
         slave_id = entry.data[CONF_SLAVE]
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
             _LOGGER.error("Internal Modbus hub not initialised")
             return
-        hub = store["hub"]
-        batch = store.get("batch")
+        hub = store.hub
+        batch = store.batch
         long_interval = entry.options.get("long_scan_interval", entry.data.get("long_scan_interval", 7200))
 
         device_info = DeviceInfo(
@@ -151,7 +151,10 @@ class R290HeatPumpModbusSelect(SelectEntity):
         if option not in self._options:
             raise ValueError("Invalid option")
         value = self._options[option]
-        await self._hub.async_pb_write_register(self._slave, self._address, int(value))
+        if self._batch:
+            await self._batch.schedule_write(self._address, int(value))
+        else:
+            await self._hub.async_pb_write_register(self._slave, self._address, int(value))
         self._current_option = option
 
     async def async_update(self):
@@ -1,6 +1,7 @@
 # Version: 1.0.1
 # Last modified: 2025-10-24 17:33 by CNC-Buddy
 import logging
+import weakref
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -35,7 +36,7 @@ from .cop_calculator import setup_cop_sensors
 
 from .temperature_curve import R290HeatPumpTemperatureCurveSensor
 
-from .const import DOMAIN
+from .const import DOMAIN, DOMAIN_KEY_BRIDGE_STATUS
 
 
 
@@ -73,15 +74,15 @@ async def async_setup_entry(
 
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
 
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
 
             _LOGGER.error("Internal Modbus hub not initialised")
 
             return
 
-        hub = store["hub"]
+        hub = store.hub
 
-        batch = store.get("batch")
+        batch = store.batch
 
 
 
@@ -231,15 +232,15 @@ async def async_setup_entry(
 
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
 
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
 
             _LOGGER.error("Internal Modbus hub not initialised (bridge)")
 
             return
 
-        hub = store["hub"]
+        hub = store.hub
 
-        batch = store.get("batch")
+        batch = store.batch
 
         bridge_device_info = DeviceInfo(
 
@@ -297,13 +298,13 @@ async def async_setup_entry(
 
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
 
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
 
             _LOGGER.error("Internal Modbus hub not initialised (curve)")
 
             return
 
-        hub = store["hub"]
+        hub = store.hub
 
         meta_map = {
 
@@ -445,7 +446,9 @@ class R290HeatPumpModbusSensor(SensorEntity):
 
         self._attr_device_info = device_info
 
-        self._attr_should_poll = True
+        # Batch-backed sensors are pushed by the batch manager on value changes
+
+        self._attr_should_poll = batch_manager is None
 
         # Optional: default enabled flag and bit label mapping for bitfield sensors
 
@@ -563,6 +566,14 @@ class R290HeatPumpModbusSensor(SensorEntity):
 
                 self._batch.register(self._address, interval)
 
+                self.async_on_remove(self._batch.register_callback(self._address, self._handle_value))
+
+                cached = self._batch.get_cached(self._address, interval)
+
+                if cached is not None:
+
+                    self._decode(cached)
+
                 if hasattr(self._batch, "request_refresh"):
 
                     await self._batch.request_refresh(interval)
@@ -585,69 +596,90 @@ class R290HeatPumpModbusSensor(SensorEntity):
 
             if value is not None:
 
-                if self._bit_index is not None:
+                self._decode(value)
 
+            # else: keep last state until batch provides a value
 
+        except Exception as e:
 
-                    try:
+            _LOGGER.debug("Sensor update failed for %s: %s", self._name, e)
 
 
 
-                        iv = int(value)
 
+    def _decode(self, value) -> None:
 
+        """Convert a raw register value into the sensor state."""
 
-                        self._state = self._bit_on_state if iv & (1 << int(self._bit_index)) else self._bit_off_state
+        if self._bit_index is not None:
 
 
 
-                    except Exception:
+            try:
 
 
 
-                        self._state = None
+                iv = int(value)
 
 
 
-                elif self._bit_labels is not None:
+                self._state = self._bit_on_state if iv & (1 << int(self._bit_index)) else self._bit_off_state
 
-                    try:
 
-                        iv = int(value)
 
-                        labels = [lbl for bit, lbl in sorted(self._bit_labels.items()) if iv & (1 << int(bit)) and lbl]
+            except Exception:
 
-                        self._state = ", ".join(labels) if labels else "None"
 
-                    except Exception:
 
-                        # fallback to raw value if decoding fails
+                self._state = None
 
-                        self._state = str(value)
 
-                elif self._bitfield:
 
-                    try:
+        elif self._bit_labels is not None:
 
-                        iv = int(value)
+            try:
 
-                        bits = [str(b) for b in range(16) if iv & (1 << b)]
+                iv = int(value)
 
-                        self._state = "Bits: " + ", ".join(bits) if bits else "None"
+                labels = [lbl for bit, lbl in sorted(self._bit_labels.items()) if iv & (1 << int(bit)) and lbl]
 
-                    except Exception:
+                self._state = ", ".join(labels) if labels else "None"
 
-                        self._state = str(value)
+            except Exception:
 
-                else:
+                # fallback to raw value if decoding fails
 
-                    self._state = round(value * self._scale, self._precision)
+                self._state = str(value)
 
-            # else: keep last state until batch provides a value
+        elif self._bitfield:
 
-        except Exception as e:
+            try:
 
-            _LOGGER.debug("Sensor update failed for %s: %s", self._name, e)
+                iv = int(value)
+
+                bits = [str(b) for b in range(16) if iv & (1 << b)]
+
+                self._state = "Bits: " + ", ".join(bits) if bits else "None"
+
+            except Exception:
+
+                self._state = str(value)
+
+        else:
+
+            self._state = round(value * self._scale, self._precision)
+
+
+
+    @callback
+
+    def _handle_value(self, value) -> None:
+
+        """Push update from the batch manager; only fired when the raw value changed."""
+
+        self._decode(value)
+
+        self.async_write_ha_state()
 
 
 
@@ -689,6 +721,14 @@ class R290HeatPumpModbusStatusSensor(SensorEntity):
 
 
 
+    async def async_added_to_hass(self):
+
+        # Let the reconnect button and options flow find us without an entity_id lookup
+
+        self._hass.data.setdefault(DOMAIN, {})[DOMAIN_KEY_BRIDGE_STATUS] = weakref.ref(self)
+
+
+
     @property
 
     def name(self):
@@ -34,12 +34,12 @@ async def async_setup_entry(
             return
 
         store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-        if not store or "hub" not in store:
+        if store is None or store.hub is None:
             _LOGGER.error("Internal Modbus hub not initialised (switch)")
             return
 
-        hub = store["hub"]
-        batch = store.get("batch")
+        hub = store.hub
+        batch = store.batch
         fast_interval = entry.options.get(
             CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 60)
         )
@@ -320,7 +320,10 @@ class R290HeatPumpWaterCirculationSwitch(SwitchEntity):
         return max(0, float(duration) * self._duration_scale)
 
     async def _write_register(self, value: int) -> None:
-        await self._hub.async_pb_write_register(self._slave, self._address, int(value))
+        if self._batch:
+            await self._batch.schedule_write(self._address, int(value))
+        else:
+            await self._hub.async_pb_write_register(self._slave, self._address, int(value))
         try:
             if self._batch and hasattr(self._batch, "request_refresh"):
                 await self._batch.request_refresh(self._scan_interval)